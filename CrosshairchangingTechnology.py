@@ -2,116 +2,2013 @@ import sys
 import math
 import random
 import os
+import re
 import threading
 import time
+import ctypes
+import ctypes.util
+import multiprocessing
+from array import array
+from collections import OrderedDict, deque, namedtuple
 
 import numpy as np
 import mss
+import mss.exception
 from PIL import Image, ImageOps
 import pytesseract
 
-from PyQt5.QtCore import Qt, QTimer, QPointF
+from PyQt5.QtCore import Qt, QTimer, QPointF, QLine, QRect, pyqtSignal
 from PyQt5.QtGui import (
     QPainter,
     QPen,
     QColor,
     QFont,
+    QFontMetrics,
+    QStaticText,
+    QTransform,
     QPixmap,
+    QImage,
     QCursor,
+    QRegion,
 )
 from PyQt5.QtWidgets import QApplication, QWidget
 
 
 ASSETS_DIR = "assets"
 HOTKEY_KEY = "f9"
-
-
-def load_pixmap(filename):
+OCR_BACKEND = "auto"   # "auto", "libtesseract" or "pytesseract"
+OCR_PSM = 7           # rows are OCR'd one killfeed line at a time
+OCR_OEM = 3
+OCR_DPI = 300         # raw buffers carry no resolution; tesseract warns and guesses without one
+KILLFEED_FADE = 6.0   # seconds a killfeed entry stays on screen
+
+# OCR polling: fast while the killfeed changes, back to the idle gap when it's static
+OCR_MIN_INTERVAL = 0.08     # seconds between grabs while active
+OCR_MAX_INTERVAL = 0.25     # idle gap = worst-case delay before a new kill is seen
+OCR_BURST_TIME = 2.0        # stay fast this long after the last change
+OCR_DECAY = 1.25            # then grow the gap by this factor per grab
+OCR_CPU_BUDGET = 0.2        # most of the wall time the watcher may spend working
+
+USE_SPRITES = True          # False = draw every primitive each frame (for comparisons)
+SPRITE_PHASE_STEPS = 64     # fewest frames per animation cycle in the sprite cache (more at high fps)
+SPRITE_CACHE_MB = 32
+
+TARGET_FPS = 60             # 30 / 60 / 144 / 240..., or 0 = display refresh rate
+MAX_FRAME_DT = 0.1          # longest step the animations take after a stall
+IDLE_FPS = 10               # cursor polling rate while the crosshair is at rest
+PHYSICS_DT = 1.0 / 60       # cursor speed and trail decay are tuned per 1/60 s, at any TARGET_FPS
+
+COMPACT_WINDOW = True       # size the overlay to the crosshair instead of the whole screen
+COMPACT_MIN_SIZE = 300
+
+# longest side (logical px) the mode images are shrunk to
+ASSET_SIZES = {
+    "cute_guy.png": 260,
+    "angel_guy.png": 200,
+    "devil_guy.png": 200,
+    "duck_guy.png": 200,
+}
+DUCK_SQUISH_STEPS = 16      # duck sizes between still and full speed, each scaled once
+PRELOAD_ASSETS = True       # False = only load an image when its mode first shows it
+
+STATS_HUD = False           # timing stats next to the mode label
+STATS_LOG = None            # e.g. "overlay_stats.jsonl": append a stats snapshot every STATS_INTERVAL
+STATS_INTERVAL = 5.0
+
+# screen rects (left, top, width, height); negative left = from the right edge
+KILLFEED_REGION = (-700, 30, 700, 320)
+KILL_BANNER_REGION = None   # e.g. (760, 780, 400, 110) to also react to the kill banner
+OCR_IN_PROCESS = False      # True = run the OCR watcher in its own process (no GIL sharing)
+
+# your name(s) - common OCR misreads are matched automatically
+KILLFEED_NAMES = [
+    "dieselderek",
+]
+KILLFEED_MAX_EDITS = 2      # most typos allowed per name (names under 8 letters get fewer)
+
+# OCR misreads folded to one letter before matching (in names and killfeed lines)
+OCR_CONFUSIONS = str.maketrans({"1": "l", "i": "l", "|": "l", "!": "l", "0": "o", "5": "s"})
+OCR_DIGRAPHS = {"rn": "m", "vv": "w"}
+
+
+class _FoldTable(dict):
+    """str.translate table: lowercase + OCR_CONFUSIONS, drops non-alphanumerics."""
+
+    def __missing__(self, code):
+        f = chr(code).lower().translate(OCR_CONFUSIONS)
+        f = f if len(f) == 1 and f.isalnum() else ""
+        self[code] = f
+        return f
+
+
+FOLD_TABLE = _FoldTable()
+
+
+def load_image(filename):
     path = os.path.join(ASSETS_DIR, filename)
     if not os.path.isfile(path):
         print(f"[overlay] missing asset: {path}")
         return None
-    pm = QPixmap(path)
-    if pm.isNull():
+    img = QImage(path)
+    if img.isNull():
         print(f"[overlay] failed to load: {path}")
         return None
-    return pm
+    return img
+
+
+class AssetCache:
+    """
+    Mode images, loaded on first use instead of at startup.
+    - pixmap(name, scale, dpr): the image smooth-scaled to fit ASSET_SIZES[name]
+      logical px times `scale`, with `dpr` physical pixels per logical one;
+      returns (pixmap, logical width, logical height), None if it's missing
+    - every variant is scaled once and cached per (name, scale, dpr)
+    - preload(jobs): does the decoding and scaling in a background thread
+      (QImage works off the GUI thread, QPixmap doesn't, so only the cheap
+      conversion is left for first use); the full-size sources are dropped after
+    """
+
+    def __init__(self):
+        self.sources = {}    # name -> full-size QImage (None = missing)
+        self.images = {}     # (name, scale, dpr) -> scaled QImage, waiting for first use
+        self.pixmaps = {}    # (name, scale, dpr) -> (QPixmap, w, h) or None
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def _scaled(self, key):
+        with self.lock:
+            if key in self.images:
+                return self.images.pop(key)
+            name, scale, dpr = key
+            if name not in self.sources:
+                self.sources[name] = load_image(name)
+            src = self.sources[name]
+            if src is None:
+                return None
+            w, h = src.width(), src.height()
+            fit = min(ASSET_SIZES[name] / float(max(w, h)), 1.0) * scale
+            img = src.scaled(
+                int(w * fit * dpr),
+                int(h * fit * dpr),
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation,
+            )
+            img.setDevicePixelRatio(dpr)
+            return img
+
+    def pixmap(self, name, scale=1.0, dpr=1.0):
+        key = (name, scale, dpr)
+        entry = self.pixmaps.get(key, False)
+        if entry is False:
+            img = self._scaled(key)
+            entry = None
+            if img is not None:
+                entry = (
+                    QPixmap.fromImage(img),
+                    int(math.ceil(img.width() / dpr)),
+                    int(math.ceil(img.height() / dpr)),
+                )
+            with self.lock:
+                self.pixmaps[key] = entry
+        return entry
 
+    def preload(self, jobs):
+        """Scale `jobs` [(name, scale, dpr), ...] ahead of their first use."""
+        def worker():
+            t0 = time.perf_counter()
+            for key in jobs:
+                if key in self.pixmaps:
+                    continue
+                img = self._scaled(key)
+                with self.lock:
+                    if img is not None and key not in self.pixmaps:
+                        self.images[key] = img
+            with self.lock:
+                self.sources.clear()
+            print(f"[overlay] preloaded {len(jobs)} images in {(time.perf_counter() - t0) * 1000:.0f} ms")
+
+        self.thread = threading.Thread(target=worker, daemon=True)
+        self.thread.start()
+
+
+class OcrPreprocessor:
+    """
+    NumPy version of the old PIL killfeed preprocessing:
+    - crop to the middle rows by slicing
+    - grayscale with PIL's integer luma weights
+    - autocontrast + threshold folded into one 256-entry LUT
+    - optional nearest-neighbour upscale
+    binarize() takes the raw mss buffer (H x W x 3/4 uint8) and returns a
+    0/255 uint8 array, scale() upscales that for OCR; calling the
+    preprocessor does both. Work buffers are kept between calls, so the
+    returned arrays are overwritten by the next call.
+    """
+
+    def __init__(self, crop_top=0.15, crop_bottom=0.85, threshold=160,
+                 cutoff=0, upscale=2):
+        self.crop_top = crop_top
+        self.crop_bottom = crop_bottom
+        self.threshold = threshold
+        self.cutoff = cutoff
+        self.upscale = upscale
+        self._ramp = np.arange(256, dtype=np.float64)
+        self._identity = np.arange(256, dtype=np.uint8)
+        self._scratch = {}
+
+    def _buffer(self, name, shape, dtype):
+        buf = self._scratch.get(name)
+        if buf is None or buf.shape != shape:
+            buf = np.empty(shape, dtype=dtype)
+            self._scratch[name] = buf
+        return buf
+
+    def grayscale(self, arr):
+        h = arr.shape[0]
+        rows = arr[int(h * self.crop_top):int(h * self.crop_bottom)]
+        shape = rows.shape[:2]
+        acc = self._buffer("acc", shape, np.uint32)
+        tmp = self._buffer("tmp", shape, np.uint32)
+        gray = self._buffer("gray", shape, np.uint8)
+
+        # same fixed-point weights PIL uses for "RGB" -> "L"
+        np.multiply(rows[..., 0], np.uint32(19595), out=acc)
+        np.multiply(rows[..., 1], np.uint32(38470), out=tmp)
+        acc += tmp
+        np.multiply(rows[..., 2], np.uint32(7471), out=tmp)
+        acc += tmp
+        acc += np.uint32(0x8000)
+        acc >>= 16
+        np.copyto(gray, acc, casting="unsafe")
+        return gray
+
+    def contrast_range(self, gray):
+        if not self.cutoff:
+            return int(gray.min()), int(gray.max())
+
+        hist = np.bincount(gray.ravel(), minlength=256)
+        cut = int(gray.size * self.cutoff // 100)
+        lo = int(np.argmax(np.cumsum(hist) > cut))
+        hi = 255 - int(np.argmax(np.cumsum(hist[::-1]) > cut))
+        return lo, hi
+
+    def binarize_lut(self, lo, hi):
+        if hi <= lo:
+            lut = self._identity
+        else:
+            scale = 255.0 / (hi - lo)
+            lut = np.clip((self._ramp * scale + (-lo * scale)).astype(np.int64), 0, 255)
+        return np.where(lut > self.threshold, 255, 0).astype(np.uint8)
+
+    def __call__(self, arr):
+        return self.scale(self.binarize(arr))
+
+    def binarize(self, arr):
+        gray = self.grayscale(arr)
+        lo, hi = self.contrast_range(gray)
+        out = self._buffer("out", gray.shape, np.uint8)
+        mask = self._buffer("mask", gray.shape, np.bool_)
+
+        # the LUT is monotonic, so the lookup is a single >= on the gray level
+        lit = np.flatnonzero(self.binarize_lut(lo, hi))
+        if lit.size:
+            np.greater_equal(gray, np.uint8(lit[0]), out=mask)
+            np.multiply(mask.view(np.uint8), np.uint8(255), out=out)
+        else:
+            out.fill(0)
+        return out
+
+    def scale(self, mask):
+        f = self.upscale
+        if not f or f <= 1:
+            return mask
+        h, w = mask.shape
+        up = self._buffer("up", (h * f, w * f), np.uint8)
+        blocks = up.reshape(h, f, w, f)
+        for i in range(f):
+            for j in range(f):
+                blocks[:, i, :, j] = mask
+        return up
+
+
+class ScreenGrabber:
+    """
+    One long-lived mss session plus a small ring of preallocated BGRA frames.
+    - mss is opened lazily in the grabbing thread (its handles are per-thread)
+    - grab() views the shot's bytes in place and copies them into the next
+      ring slot, so no numpy arrays are allocated per frame
+    - a slot stays valid until the ring wraps around (ring_size grabs)
+    """
+
+    def __init__(self, monitor, ring_size=3):
+        self.monitor = dict(monitor)
+        self.ring_size = ring_size
+        self._alloc(monitor["height"], monitor["width"])
+        self.sct = None
+
+    def _alloc(self, h, w):
+        self.ring = [np.empty((h, w, 4), dtype=np.uint8) for _ in range(self.ring_size)]
+        self.index = -1
+
+    def grab(self):
+        if self.sct is None:
+            self.sct = mss.mss()
+        shot = self.sct.grab(self.monitor)
+
+        h, w = shot.height, shot.width
+        if self.ring[0].shape[:2] != (h, w):
+            # HiDPI: physical pixels can differ from the requested size
+            self._alloc(h, w)
+
+        self.index = (self.index + 1) % self.ring_size
+        frame = self.ring[self.index]
+        np.copyto(frame, np.frombuffer(shot.raw, dtype=np.uint8).reshape(h, w, 4))
+        return frame
+
+    def close(self):
+        if self.sct is not None:
+            try:
+                self.sct.close()
+            except Exception:
+                pass
+            self.sct = None
+
+
+class FrameChangeGate:
+    """
+    Decides whether a binarized killfeed frame is worth sending to Tesseract.
+    Runs on the 1x mask, before the upscale: 8 px tiles with a tolerance of
+    2 lit pixels are the 16 px / 8 pixel tiles of the 2x mask, at 1/4 the work.
+    - frame is cut into tile x tile blocks, each reduced to its lit-pixel count
+    - a tile counts as changed if its count moved by more than pixel_tolerance
+    - frame counts as new if more than tile_tolerance tiles changed
+    """
+
+    def __init__(self, tile=8, pixel_tolerance=2, tile_tolerance=0):
+        self.tile = tile
+        self.pixel_tolerance = pixel_tolerance
+        self.tile_tolerance = tile_tolerance
+        self.prev_tiles = None
+        self.frames_skipped = 0
+        self.frames_recognized = 0
+
+    def signature(self, mask):
+        t = self.tile
+        th = mask.shape[0] // t
+        tw = mask.shape[1] // t
+        blocks = mask[:th * t, :tw * t].reshape(th, t, tw, t)
+        return np.count_nonzero(blocks, axis=(1, 3)).astype(np.int32)
+
+    def changed(self, mask):
+        tiles = self.signature(mask)
+        prev = self.prev_tiles
+
+        if prev is None or prev.shape != tiles.shape:
+            is_new = True
+        else:
+            diff = np.abs(tiles - prev) > self.pixel_tolerance
+            is_new = int(np.count_nonzero(diff)) > self.tile_tolerance
 
-class CrosshairOverlay(QWidget):
-    def __init__(self, screen_width=1920, screen_height=1080):
-        super().__init__()
+        if is_new:
+            self.prev_tiles = tiles
+            self.frames_recognized += 1
+        else:
+            self.frames_skipped += 1
+        return is_new
 
-        self.screen_width = screen_width
-        self.screen_height = screen_height
-        self.center_x = screen_width // 2
-        self.center_y = screen_height // 2
+    def reset(self):
+        self.prev_tiles = None
 
-    
-        self.setWindowFlags(
-            Qt.FramelessWindowHint |
-            Qt.WindowStaysOnTopHint |
-            Qt.Tool
+
+class PytesseractBackend:
+    """Fallback: runs the tesseract binary through pytesseract (one process per call)."""
+
+    name = "pytesseract"
+
+    def __init__(self, psm=OCR_PSM, oem=OCR_OEM, dpi=OCR_DPI):
+        self.config = f"--psm {psm} --oem {oem} --dpi {dpi}"
+
+    def recognize(self, gray):
+        return pytesseract.image_to_string(gray, config=self.config)
+
+
+class LibTesseractBackend:
+    """
+    Persistent in-process engine through the libtesseract C API (ctypes).
+    - TessBaseAPI is created and initialised once
+    - frames are handed over as raw 8-bit grayscale buffers, no temp files
+    - SetImage resets the source resolution, so `dpi` is set after each one
+      (otherwise tesseract prints "Invalid resolution 0 dpi" on every row)
+    """
+
+    name = "libtesseract"
+
+    LIB_NAMES = ("tesseract", "libtesseract-5", "libtesseract-4", "libtesseract")
+
+    def __init__(self, lang="eng", psm=OCR_PSM, oem=OCR_OEM, datapath=None, dpi=OCR_DPI):
+        self.dpi = dpi
+        self.lib = self._load_lib()
+        lib = self.lib
+
+        lib.TessBaseAPICreate.restype = ctypes.c_void_p
+        lib.TessBaseAPIInit2.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int,
+        ]
+        lib.TessBaseAPIInit2.restype = ctypes.c_int
+        lib.TessBaseAPISetPageSegMode.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        lib.TessBaseAPISetImage.argtypes = [
+            ctypes.c_void_p, ctypes.c_void_p,
+            ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+        ]
+        lib.TessBaseAPISetSourceResolution.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        lib.TessBaseAPIGetUTF8Text.argtypes = [ctypes.c_void_p]
+        lib.TessBaseAPIGetUTF8Text.restype = ctypes.c_void_p
+        lib.TessDeleteText.argtypes = [ctypes.c_void_p]
+        lib.TessBaseAPIEnd.argtypes = [ctypes.c_void_p]
+        lib.TessBaseAPIDelete.argtypes = [ctypes.c_void_p]
+
+        self.handle = lib.TessBaseAPICreate()
+        if datapath is None:
+            datapath = os.environ.get("TESSDATA_PREFIX")
+        rc = lib.TessBaseAPIInit2(
+            self.handle,
+            datapath.encode() if datapath else None,
+            lang.encode(),
+            oem,
         )
-        self.setAttribute(Qt.WA_TranslucentBackground, True)
-        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
-        self.setGeometry(0, 0, self.screen_width, self.screen_height)
+        if rc != 0:
+            lib.TessBaseAPIDelete(self.handle)
+            self.handle = None
+            raise RuntimeError(f"TessBaseAPIInit2 failed ({rc}), lang={lang}")
+        lib.TessBaseAPISetPageSegMode(self.handle, psm)
+        self.lock = threading.Lock()
+
+    @classmethod
+    def _load_lib(cls):
+        for name in cls.LIB_NAMES:
+            path = ctypes.util.find_library(name)
+            if path:
+                return ctypes.CDLL(path)
+        for name in ("libtesseract.so.5", "libtesseract.so.4"):
+            try:
+                return ctypes.CDLL(name)
+            except OSError:
+                pass
+        raise OSError("libtesseract not found")
+
+    def recognize(self, gray):
+        gray = np.ascontiguousarray(gray, dtype=np.uint8)
+        h, w = gray.shape
+        with self.lock:
+            self.lib.TessBaseAPISetImage(self.handle, gray.ctypes.data, w, h, 1, w)
+            self.lib.TessBaseAPISetSourceResolution(self.handle, self.dpi)
+            ptr = self.lib.TessBaseAPIGetUTF8Text(self.handle)
+            if not ptr:
+                return ""
+            try:
+                return ctypes.string_at(ptr).decode("utf-8", "replace")
+            finally:
+                self.lib.TessDeleteText(ptr)
 
-        
-        self.modes = [
-            "static",
-            "shaky",
-            "orbit_ball",
-            "cute_quotes",
-            "angel_devil",
-            "duck",
-            "sleepy",
-            "pointer",
-            "blackhole",
-            "panic",
-            "jelly",
-            "broken",
-            "lag_echo",
-            "focus_window",
-            "overheated",
-            "metronome",
-            "mega_cross",   
+    def close(self):
+        if self.handle:
+            self.lib.TessBaseAPIEnd(self.handle)
+            self.lib.TessBaseAPIDelete(self.handle)
+            self.handle = None
+
+
+def make_ocr_backend(kind=OCR_BACKEND):
+    if kind in ("auto", "libtesseract"):
+        try:
+            return LibTesseractBackend()
+        except (OSError, RuntimeError, AttributeError) as e:
+            if kind == "libtesseract":
+                raise
+            print("[OCR] libtesseract unavailable, using pytesseract:", e)
+    return PytesseractBackend()
+
+
+class KillfeedRows:
+    """
+    Splits the binarized killfeed into entry rows and only OCRs new ones.
+    - rows come from the horizontal projection profile of the mask
+    - each row is trimmed to its ink and hashed
+    - LRU cache of row hash -> [text, last_seen], entries expire after `fade`
+    read() returns (y0, y1, text) for every row on screen; only rows with an
+    unseen hash go through OCR.
+    """
+
+    def __init__(self, recognize, fade=KILLFEED_FADE, min_ink=2,
+                 min_height=8, max_gap=3, margin=4, cache_size=64):
+        self.recognize = recognize
+        self.fade = fade
+        self.min_ink = min_ink
+        self.min_height = min_height
+        self.max_gap = max_gap
+        self.margin = margin
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.visible = []
+        self.hits = 0
+        self.misses = 0
+
+    def segment(self, mask):
+        active = np.count_nonzero(mask, axis=1) > self.min_ink
+        edges = np.diff(np.concatenate(([0], active.view(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+
+        rows = []
+        for y0, y1 in zip(starts.tolist(), ends.tolist()):
+            if rows and y0 - rows[-1][1] <= self.max_gap:
+                rows[-1][1] = y1
+            else:
+                rows.append([y0, y1])
+        return [(y0, y1) for y0, y1 in rows if y1 - y0 >= self.min_height]
+
+    def _expire(self, now):
+        cache = self.cache
+        while cache:
+            key, entry = next(iter(cache.items()))
+            if now - entry[1] <= self.fade and len(cache) <= self.cache_size:
+                break
+            cache.popitem(last=False)
+
+    def keep_alive(self, now):
+        """Frame unchanged: rows from the last read are still on screen."""
+        for key in self.visible:
+            entry = self.cache.get(key)
+            if entry is not None:
+                entry[1] = now
+
+    def read(self, mask, now):
+        self._expire(now)
+        rows = []
+        self.visible = []
+
+        for y0, y1 in self.segment(mask):
+            band = mask[y0:y1]
+            cols = np.flatnonzero(band.any(axis=0))
+            band = band[:, cols[0]:cols[-1] + 1]
+            key = hash((band.shape, band.tobytes()))
+            self.visible.append(key)
+
+            entry = self.cache.get(key)
+            if entry is not None:
+                self.hits += 1
+                entry[1] = now
+                self.cache.move_to_end(key)
+            else:
+                self.misses += 1
+                entry = [self.recognize(np.pad(band, self.margin)).strip(), now]
+                self.cache[key] = entry
+            if entry[0]:
+                rows.append((y0, y1, entry[0]))
+
+        return rows
+
+
+def edit_distance(a, b, limit):
+    """Levenshtein distance of a and b, or limit + 1 once it is over limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j - 1] + (ca != cb), prev[j] + 1, cur[j - 1] + 1))
+        if min(cur) > limit:
+            return limit + 1
+        prev = cur
+    return min(prev[-1], limit + 1)
+
+
+class KillfeedTracker:
+    """
+    Gives killfeed entries an identity across frames, so each fires once.
+    - table of active entries: [row y, folded text, first_seen, last_seen]
+    - rows claim entries by folded text, exact first, then within
+      len // 6 edits (OCR noise on a re-read); the nearest row wins, so a
+      second kill with the same text is still a new entry
+    - unclaimed rows are new entries; entries unseen for `fade` expire
+    - at most max_entries entries (more than a killfeed shows), so a frame
+      costs at most rows x max_entries comparisons
+    update(rows, now) returns the rows that are new entries.
+    """
+
+    def __init__(self, fade=KILLFEED_FADE, max_entries=16):
+        self.fade = fade
+        self.max_entries = max_entries
+        self.entries = []
+        self.visible = []
+
+    def keep_alive(self, now):
+        for e in self.visible:
+            e[3] = now
+
+    def _claim(self, row, entries, claimed, match):
+        best = None
+        for e in entries:
+            if id(e) in claimed:
+                continue
+            dist = match(e[1])
+            if dist is not None:
+                key = (dist, abs(e[0] - row[0]))
+                if best is None or key < best[0]:
+                    best = (key, e)
+        if best is None:
+            return None
+        e = best[1]
+        claimed.add(id(e))
+        return e
+
+    def update(self, rows, now):
+        fade = self.fade
+        self.entries = entries = [e for e in self.entries if now - e[3] <= fade]
+        claimed = set()
+        self.visible = []
+        pending = []
+
+        for row in rows:
+            folded = NameMatcher.fold_text(row[2])
+            if not folded:
+                continue
+            e = self._claim(row, entries, claimed, lambda t: 0 if t == folded else None)
+            if e is None:
+                pending.append((row, folded))
+            else:
+                e[0], e[3] = row[0], now
+                self.visible.append(e)
+
+        new_rows = []
+        for row, folded in pending:
+            limit = max(1, len(folded) // 6)
+
+            def near(t):
+                dist = edit_distance(folded, t, limit)
+                return dist if dist <= limit else None
+
+            e = self._claim(row, entries, claimed, near)
+            if e is None:
+                e = [row[0], folded, now, now]
+                entries.append(e)
+                claimed.add(id(e))
+                new_rows.append(row)
+            e[0], e[3] = row[0], now
+            self.visible.append(e)
+
+        if len(entries) > self.max_entries:
+            entries.sort(key=lambda e: e[3])
+            del entries[:len(entries) - self.max_entries]
+        return new_rows
+
+
+class PollScheduler:
+    """
+    Picks the OCR watcher's sleep between grabs.
+    - drops to min_interval while the killfeed is active (multi-kills)
+    - stays fast for burst_time, then grows by `decay` per static frame
+      up to max_interval
+    - never lets OCR work exceed cpu_budget of wall time
+    - errors back off exponentially from error_interval to max_error_interval
+    """
+
+    def __init__(self, min_interval=OCR_MIN_INTERVAL, max_interval=OCR_MAX_INTERVAL,
+                 burst_time=OCR_BURST_TIME, decay=OCR_DECAY, cpu_budget=OCR_CPU_BUDGET,
+                 error_interval=0.5, max_error_interval=8.0):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.burst_time = burst_time
+        self.decay = decay
+        self.cpu_budget = cpu_budget
+        self.error_interval = error_interval
+        self.max_error_interval = max_error_interval
+
+        self.interval = max_interval
+        self.last_change = -burst_time
+        self.errors = 0
+
+    def next_delay(self, now, work_time, active):
+        self.errors = 0
+        if active:
+            self.last_change = now
+
+        if now - self.last_change < self.burst_time:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.decay, self.max_interval)
+
+        # keep work / (work + sleep) under the cpu budget
+        budget_floor = work_time / self.cpu_budget - work_time
+        return max(self.interval - work_time, budget_floor, 0.0)
+
+    def error_delay(self):
+        delay = min(self.error_interval * (2 ** self.errors), self.max_error_interval)
+        self.errors += 1
+        return delay
+
+
+NameMatch = namedtuple("NameMatch", "name start end edits")
+
+
+class NameMatcher:
+    """
+    Finds watched player names in OCR'd killfeed lines.
+    - names and lines are folded the same way: lowercase, OCR confusions
+      (l/1/i, o/0, rn/m, ...) mapped to one letter, spaces and symbols dropped
+    - a name allows len // 4 edits, capped at max_edits
+    - a name read with k edits still has one of its k + 1 pieces intact, so
+      all pieces go into one compiled regex and each hit is verified with a
+      small edit-distance DP around it
+    find(line) returns NameMatch(name, start, end, edits) per name found,
+    with start/end indexing the original line.
+    """
+
+    def __init__(self, names, max_edits=KILLFEED_MAX_EDITS):
+        self.names = []
+        pieces = {}   # piece -> [(name index, offset in folded name)]
+        for name in names:
+            folded = self.fold_text(name)
+            if not folded:
+                continue
+            k = min(max_edits, len(folded) // 4)
+            idx = len(self.names)
+            self.names.append((name, folded, k))
+            step = len(folded) / (k + 1)
+            for j in range(k + 1):
+                a, b = int(round(j * step)), int(round((j + 1) * step))
+                pieces.setdefault(folded[a:b], []).append((idx, a))
+
+        # pieces found at the same position are prefixes of each other: the
+        # regex reports the longest one, the shorter ones are looked up here
+        order = sorted(pieces, key=len, reverse=True)
+        self.candidates = {
+            p: [c for q in order if p.startswith(q) for c in pieces[q]] for p in order
+        }
+        self.pattern = None
+        if order:
+            self.pattern = re.compile("(?=(%s))" % "|".join(map(re.escape, order)))
+
+    @staticmethod
+    def fold_text(text):
+        """Folded text only; what find() scans before anything is matched."""
+        text = text.translate(FOLD_TABLE)
+        for pair, c in OCR_DIGRAPHS.items():
+            text = text.replace(pair, c)
+        return text
+
+    @staticmethod
+    def fold(text):
+        """text -> (folded chars, start index, end index) lists."""
+        out, starts, ends = [], [], []
+        for i, c in enumerate(text):
+            c = FOLD_TABLE[ord(c)]
+            if not c:
+                continue
+            if out:
+                pair = OCR_DIGRAPHS.get(out[-1] + c)
+                if pair is not None:
+                    out[-1] = pair
+                    ends[-1] = i + 1
+                    continue
+            out.append(c)
+            starts.append(i)
+            ends.append(i + 1)
+        return out, starts, ends
+
+    @staticmethod
+    def _verify(pat, text, lo, hi, k):
+        """Best (edits, start, end) of pat inside text[lo:hi], or None if > k."""
+        m = len(pat)
+        prev = list(range(m + 1))
+        prev_start = [lo] * (m + 1)
+        best = None
+        for j in range(lo, min(hi, len(text))):
+            c = text[j]
+            cur = [0] * (m + 1)
+            cur_start = [j + 1] * (m + 1)
+            for i in range(1, m + 1):
+                d, s = prev[i - 1] + (pat[i - 1] != c), prev_start[i - 1]
+                if prev[i] + 1 < d:
+                    d, s = prev[i] + 1, prev_start[i]
+                if cur[i - 1] + 1 < d:
+                    d, s = cur[i - 1] + 1, cur_start[i - 1]
+                cur[i], cur_start[i] = d, s
+            if cur[m] <= k and (best is None or cur[m] < best[0]):
+                best = (cur[m], cur_start[m], j + 1)
+            prev, prev_start = cur, cur_start
+        return best
+
+    def find(self, line):
+        if self.pattern is None:
+            return []
+        text = self.fold_text(line)
+
+        best = {}
+        for hit in self.pattern.finditer(text):
+            pos = hit.start()
+            for idx, offset in self.candidates[hit.group(1)]:
+                prev = best.get(idx)
+                if prev is not None and prev[0] == 0:
+                    continue
+                name, pat, k = self.names[idx]
+                at = pos - offset
+                if text.startswith(pat, at):
+                    found = (0, at, at + len(pat))
+                else:
+                    found = self._verify(pat, text, max(0, at - k), at + len(pat) + k, k)
+                if found is not None and (prev is None or found[0] < prev[0]):
+                    best[idx] = found
+
+        if not best:
+            return []
+        _, starts, ends = self.fold(line)
+        matches = [
+            NameMatch(self.names[idx][0], starts[s], ends[e - 1], edits)
+            for idx, (edits, s, e) in best.items()
         ]
-        self.mode_index = 0
-        self.current_mode = self.modes[0]
+        matches.sort(key=lambda m: m.start)
+        return matches
 
-        
-        self.pending_name_hit = False
-        self.last_killfeed_snippet = ""
-        self.last_killfeed_time = 0.0
 
-        
-        self.dt = 1.0 / 60.0
-        self.orbit_angle = 0.0
-        self.blackhole_phase = 0.0
-        self.panic_phase = 0.0
-        self.duck_phase = 0.0
-        self.metronome_time = 0.0
+HIT_KILL = "kill"
+HIT_DEATH = "death"
+
+
+class KillfeedRule:
+    """
+    Region rule: report each new killfeed entry with a watched name, once.
+    Lines read killer -> victim, so a name with less text before it than
+    after it is a kill, otherwise a death.
+    """
+
+    def __init__(self, recognize, on_match, names=KILLFEED_NAMES):
+        self.rows = KillfeedRows(recognize)
+        self.tracker = KillfeedTracker()
+        self.matcher = NameMatcher(names)
+        self.on_match = on_match
+
+    @staticmethod
+    def side(line, match):
+        before = len(NameMatcher.fold_text(line[:match.start]))
+        after = len(NameMatcher.fold_text(line[match.end:]))
+        return HIT_KILL if before <= after else HIT_DEATH
 
-        self.jelly_scale = 1.0
-        self.jelly_vel = 0.0
+    def __call__(self, proc, changed, now):
+        if not changed:
+            self.rows.keep_alive(now)
+            self.tracker.keep_alive(now)
+        else:
+            for y0, y1, line in self.tracker.update(self.rows.read(proc, now), now):
+                found = self.matcher.find(line)
+                if found:
+                    snippet = line.lower().replace("\n", " ")
+                    self.on_match(self.side(line, found[0]), snippet, now)
+        # only changes keep polling fast: rows that sit there unchanged (an old
+        # entry, HUD text in the crop) let the interval decay to the idle rate
+        return changed
+
+
+class BannerRule:
+    """
+    Region rule for a kill banner: no OCR, fires when the region lights up.
+    - lit fraction of the binarized region above `min_lit` = banner showing
+    - fires once per appearance (rising edge)
+    """
+
+    def __init__(self, on_hit, min_lit=0.03):
+        self.on_hit = on_hit
+        self.min_lit = min_lit
+        self.showing = False
+
+    def __call__(self, proc, changed, now):
+        if changed:
+            showing = np.count_nonzero(proc) > self.min_lit * proc.size
+            if showing and not self.showing:
+                self.on_hit(HIT_KILL, "kill banner", now)
+            self.showing = showing
+        return changed
+
+
+class CaptureRegion:
+    """
+    A named screen rect the OCR watcher checks every grab.
+    - preprocess: raw BGRA view -> binarized array (binarize), upscaled for OCR (scale)
+    - gate: FrameChangeGate on the 1x mask, so rules only see content changes;
+      proc is None when nothing changed
+    - rule: callable(proc, changed, now) -> True if the region is active
+      (its content changed), which keeps the watcher polling fast
+    """
+
+    def __init__(self, name, rect, rule, preprocess=None, gate=None):
+        self.name = name
+        self.left, self.top, self.width, self.height = rect
+        self.rule = rule
+        self.preprocess = preprocess or OcrPreprocessor()
+        self.gate = gate or FrameChangeGate()
+
+    def process(self, view, now):
+        mask = self.preprocess.binarize(view)
+        gate = self.gate
+        changed = gate.changed(mask)
+        # only frames that get read are upscaled for OCR
+        proc = self.preprocess.scale(mask) if changed else None
+        if (gate.frames_skipped + gate.frames_recognized) % 240 == 0:
+            print(
+                f"[OCR] {self.name} frames recognized:", gate.frames_recognized,
+                "skipped:", gate.frames_skipped,
+            )
+        return self.rule(proc, changed, now)
+
+
+class RegionSet:
+    """
+    All capture regions, grabbed together as one bounding box per tick and
+    sliced into per-region views. Keep regions close together: the grab
+    covers everything between them.
+    """
+
+    def __init__(self, regions):
+        self.regions = list(regions)
+        left = min(r.left for r in self.regions)
+        top = min(r.top for r in self.regions)
+        right = max(r.left + r.width for r in self.regions)
+        bottom = max(r.top + r.height for r in self.regions)
+        self.monitor = {
+            "left": left,
+            "top": top,
+            "width": right - left,
+            "height": bottom - top,
+        }
+
+    def views(self, frame):
+        m = self.monitor
+        # HiDPI: the shot can be larger than the logical box
+        sy = frame.shape[0] / float(m["height"])
+        sx = frame.shape[1] / float(m["width"])
+        for r in self.regions:
+            y0 = int((r.top - m["top"]) * sy)
+            x0 = int((r.left - m["left"]) * sx)
+            yield r, frame[y0:y0 + int(r.height * sy), x0:x0 + int(r.width * sx)]
+
+    def process(self, frame, now):
+        active = False
+        for region, view in self.views(frame):
+            active = region.process(view, now) or active
+        return active
+
+    def reset(self):
+        for r in self.regions:
+            r.gate.reset()
+
+
+class RollingStat:
+    """
+    The last `size` samples of one measurement (ms) in a ring buffer.
+    record() only writes into the ring; summary() computes mean,
+    percentiles and a histogram over BINS (ms edges) when asked.
+    """
+
+    BINS = (0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 33, 66, 133, 250, 500, 1000)
+
+    def __init__(self, size=512):
+        self.samples = np.zeros(size)
+        self.count = 0
+
+    def record(self, value):
+        self.samples[self.count % self.samples.size] = value
+        self.count += 1
+
+    def summary(self):
+        n = min(self.count, self.samples.size)
+        if not n:
+            return None
+        s = self.samples[:n]
+        p50, p95, p99 = np.percentile(s, (50, 95, 99))
+        hist = np.histogram(s, bins=(0.0,) + self.BINS + (np.inf,))[0]
+        return OrderedDict([
+            ("n", self.count),
+            ("mean", float(s.mean())),
+            ("p50", float(p50)),
+            ("p95", float(p95)),
+            ("p99", float(p99)),
+            ("max", float(s.max())),
+            ("hist", hist.tolist()),
+        ])
+
+
+class RateCounter:
+    """Events per second over the last `window` seconds."""
+
+    def __init__(self, window=10.0, size=1024):
+        self.window = window
+        self.times = deque(maxlen=size)
+
+    def hit(self, t=None):
+        self.times.append(time.perf_counter() if t is None else t)
+
+    def rate(self, now):
+        cutoff = now - self.window
+        return sum(1 for t in list(self.times) if t >= cutoff) / self.window
+
+
+class Stats:
+    """
+    Rolling hot-path measurements, for frame drops without a profiler.
+    - record(name, ms) / add(name, seconds) / wrap(name, fn) feed a RollingStat
+    - hit(name) feeds a RateCounter, reported as events/sec
+    Recording is safe from the OCR thread; snapshot() is JSON-ready.
+    """
+
+    def __init__(self):
+        self.stats = {}
+        self.rates = {}
+
+    def record(self, name, ms):
+        stat = self.stats.get(name)
+        if stat is None:
+            stat = self.stats.setdefault(name, RollingStat())
+        stat.record(ms)
+
+    def add(self, name, seconds):
+        self.record(name, seconds * 1000.0)
+
+    def wrap(self, name, fn):
+        def timed(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.record(name, (time.perf_counter() - t0) * 1000.0)
+        return timed
+
+    def hit(self, name, t=None):
+        rate = self.rates.get(name)
+        if rate is None:
+            rate = self.rates.setdefault(name, RateCounter())
+        rate.hit(t)
+
+    def summary(self, name):
+        stat = self.stats.get(name)
+        return stat.summary() if stat is not None else None
+
+    def snapshot(self, now=None):
+        now = time.perf_counter() if now is None else now
+        return OrderedDict([
+            ("time", time.time()),
+            ("ms", OrderedDict(
+                (name, stat.summary()) for name, stat in sorted(list(self.stats.items()))
+            )),
+            ("per_sec", OrderedDict(
+                (name, rate.rate(now)) for name, rate in sorted(list(self.rates.items()))
+            )),
+        ])
+
+
+def instrument_regions(regions, timer):
+    """Time the pipeline stages of a RegionSet with timer.wrap (Stats or StageTimer)."""
+    for r in regions.regions:
+        r.preprocess.binarize = timer.wrap("preprocess", r.preprocess.binarize)
+        r.preprocess.scale = timer.wrap("upscale", r.preprocess.scale)
+        r.gate.changed = timer.wrap("gate", r.gate.changed)
+        if isinstance(r.rule, KillfeedRule):
+            rule = r.rule
+            rule.rows.recognize = timer.wrap("ocr", rule.rows.recognize)
+            rule.tracker.update = timer.wrap("track", rule.tracker.update)
+            rule.matcher.find = timer.wrap("match", rule.matcher.find)
+
+
+def screen_rect(rect, screen_width):
+    left, top, width, height = rect
+    if left < 0:
+        left += screen_width
+    return (left, top, width, height)
+
+
+def build_capture_regions(screen_width, backend, on_hit):
+    regions = [
+        CaptureRegion(
+            "killfeed",
+            screen_rect(KILLFEED_REGION, screen_width),
+            KillfeedRule(backend.recognize, on_hit),
+        ),
+    ]
+    if KILL_BANNER_REGION is not None:
+        regions.append(CaptureRegion(
+            "kill_banner",
+            screen_rect(KILL_BANNER_REGION, screen_width),
+            BannerRule(on_hit),
+            preprocess=OcrPreprocessor(crop_top=0.0, crop_bottom=1.0, upscale=1),
+        ))
+    return regions
+
+
+def run_ocr_watcher(screen_width, on_hit, stats=None):
+    """
+    The OCR watcher loop: grab all regions, run their rules, sleep.
+    on_hit(kind, snippet, grab_time) is called from this thread/process,
+    kind being HIT_KILL or HIT_DEATH. With `stats` the stages are timed.
+    """
+    print("[overlay] OCR watching...")
+
+    backend = make_ocr_backend()
+    print("[overlay] OCR backend:", backend.name)
+
+    regions = RegionSet(build_capture_regions(screen_width, backend, on_hit))
+    for r in regions.regions:
+        print(f"[overlay] OCR region {r.name}:", (r.left, r.top, r.width, r.height))
+    sched = PollScheduler(
+        min_interval=OCR_MIN_INTERVAL,
+        max_interval=OCR_MAX_INTERVAL,
+        burst_time=OCR_BURST_TIME,
+        decay=OCR_DECAY,
+        cpu_budget=OCR_CPU_BUDGET,
+    )
+    grabber = ScreenGrabber(regions.monitor)
+    if stats is not None:
+        instrument_regions(regions, stats)
+        grabber.grab = stats.wrap("capture", grabber.grab)
+
+    while True:
+        try:
+            grab_time = time.perf_counter()
+            try:
+                frame = grabber.grab()
+            except mss.exception.ScreenShotError:
+                # only a failed grab needs a fresh mss session
+                grabber.close()
+                raise
+
+            active = regions.process(frame, grab_time)
+
+            now = time.perf_counter()
+            time.sleep(sched.next_delay(now, now - grab_time, active))
+
+        except Exception as frame_err:
+            print("[OCR] frame error:", frame_err)
+            regions.reset()
+            time.sleep(sched.error_delay())
+
+
+def ocr_process_main(screen_width, hits):
+    """
+    Entry point of the OCR child process (OCR_IN_PROCESS): sends
+    (kind, snippet, grab_time) tuples back. perf_counter is system-wide on
+    Windows and Linux, so latency stays measurable across processes.
+    """
+    run_ocr_watcher(screen_width, lambda kind, snippet, t: hits.put((kind, snippet, t)))
+
+
+def preprocess_for_ocr_pil(pil_img):
+    """Original PIL pipeline, kept for --bench-preprocess comparisons."""
+    w, h = pil_img.size
+    pil_img = pil_img.crop((0, int(h * 0.15), w, int(h * 0.85)))
+    img = pil_img.convert("L")
+    img = ImageOps.autocontrast(img)
+
+    def thresh(x):
+        return 255 if x > 160 else 0
+
+    img = img.point(thresh, mode="L")
+    img = img.resize((img.width * 2, img.height * 2), Image.BICUBIC)
+    return img
+
+
+def bench_preprocess(frames=200, width=700, height=320):
+    """Time the PIL and NumPy preprocessing on random killfeed-sized frames."""
+    rng = np.random.default_rng(0)
+    arr = rng.integers(0, 256, size=(height, width, 4), dtype=np.uint8)
+    pil_src = Image.fromarray(arr[..., :3])
+    pre = OcrPreprocessor()
+
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        preprocess_for_ocr_pil(pil_src)
+    pil_ms = (time.perf_counter() - t0) * 1000.0 / frames
+
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        pre(arr)
+    np_ms = (time.perf_counter() - t0) * 1000.0 / frames
+
+    # compare the binarized images (before the upscale step)
+    pre_1x = OcrPreprocessor(upscale=1)
+    ref = pil_src.crop((0, int(height * 0.15), width, int(height * 0.85))).convert("L")
+    ref = ImageOps.autocontrast(ref).point(lambda x: 255 if x > 160 else 0, mode="L")
+    same = np.array_equal(np.asarray(ref), pre_1x(arr))
+
+    print(f"[bench] preprocess PIL:   {pil_ms:.3f} ms/frame")
+    print(f"[bench] preprocess NumPy: {np_ms:.3f} ms/frame ({pil_ms / np_ms:.1f}x)")
+    print(f"[bench] binarized output identical: {same}")
+
+
+def bench_ocr(frames=40):
+    """
+    Time each available OCR backend on one synthetic killfeed row, cut out
+    and padded exactly like KillfeedRows hands it over (single-line PSM).
+    """
+    from PIL import ImageDraw
+
+    img = Image.new("RGB", (700, 320), (40, 40, 40))
+    draw = ImageDraw.Draw(img)
+    for i, line in enumerate(["DieselDerek  >  enemy_one", "someone  >  DieselDerek"]):
+        draw.text((20, 90 + 40 * i), line, fill=(255, 255, 255))
+    proc = OcrPreprocessor()(np.array(img))
+    bands = []
+    KillfeedRows(lambda band: bands.append(band.copy()) or "").read(proc, 0.0)
+    row = bands[0]
+    print(f"[bench] ocr row: {row.shape[1]}x{row.shape[0]} ({len(bands)} rows in the frame)")
+
+    for kind in ("libtesseract", "pytesseract"):
+        try:
+            backend = make_ocr_backend(kind)
+            print(f"[bench] ocr {kind} reads: {backend.recognize(row).strip()!r}")
+        except Exception as e:
+            print(f"[bench] ocr {kind}: unavailable ({e})")
+            continue
+        t0 = time.perf_counter()
+        for _ in range(frames):
+            backend.recognize(row)
+        ms = (time.perf_counter() - t0) * 1000.0 / frames
+        print(f"[bench] ocr {kind}: {ms:.2f} ms/row")
+
+
+def synthetic_killfeed_lines(count, names, seed=0):
+    """Killfeed-like OCR lines; about 1 in 10 has a (mangled) watched name."""
+    rng = random.Random(seed)
+    handles = [
+        "xXsniperXx", "enemy_one", "ProGamer99", "toast", "kebab_lord",
+        "NoScope", "ghost", "quickdraw", "Player_4821", "m0rning_star",
+    ]
+    misreads = [("l", "1"), ("o", "0"), ("m", "rn"), ("e", "c"), ("i", "l")]
+    lines = []
+    for _ in range(count):
+        a, b = rng.choice(handles), rng.choice(handles)
+        if rng.random() < 0.1:
+            name = rng.choice(names)
+            for src, dst in rng.sample(misreads, 2):
+                name = name.replace(src, dst, 1)
+            a, b = (name, b) if rng.random() < 0.5 else (a, name)
+        lines.append(f"{a} {rng.choice('>»x')} {b}")
+    return lines
+
+
+def bench_match(path=None, count=20000):
+    """
+    Lines/sec of the substring check vs NameMatcher, for one name and for
+    a dozen. path = text file of recorded OCR lines, one per line.
+    """
+    team = KILLFEED_NAMES + [
+        "kebabenjoyer", "frostbyte", "nightowl", "captain_crunch", "vortexx",
+        "lemonade", "sir_reginald", "blueberry", "maplesyrup", "turbotoaster",
+        "wafflehouse",
+    ]
+    if path:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            lines = [line.rstrip("\n") for line in f if line.strip()]
+    else:
+        lines = synthetic_killfeed_lines(count, team)
+
+    for label, names in (("1 name", KILLFEED_NAMES), (f"{len(team)} names", team)):
+        lowered = [n.lower() for n in names]
+        t0 = time.perf_counter()
+        plain = sum(1 for line in lines if any(k in line.lower() for k in lowered))
+        plain_s = time.perf_counter() - t0
+
+        matcher = NameMatcher(names)
+        t0 = time.perf_counter()
+        fuzzy = sum(1 for line in lines if matcher.find(line))
+        fuzzy_s = time.perf_counter() - t0
+
+        print(f"[bench] match {label}, {len(lines)} lines:")
+        print(f"[bench]   substring:   {len(lines) / plain_s:10.0f} lines/s, {plain} matched")
+        print(f"[bench]   NameMatcher: {len(lines) / fuzzy_s:10.0f} lines/s, {fuzzy} matched")
+
+
+class StageTimer:
+    """Wall time per pipeline stage; wrap() times every call of a function."""
+
+    def __init__(self):
+        self.totals = OrderedDict()
+        self.calls = {}
+
+    def add(self, stage, seconds):
+        self.totals[stage] = self.totals.get(stage, 0.0) + seconds
+        self.calls[stage] = self.calls.get(stage, 0) + 1
+
+    def wrap(self, stage, fn):
+        def timed(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.add(stage, time.perf_counter() - t0)
+        return timed
+
+    def report(self, frames):
+        return OrderedDict(
+            (stage, {
+                "calls": self.calls[stage],
+                "ms_per_frame": total * 1000.0 / max(frames, 1),
+                "ms_per_call": total * 1000.0 / self.calls[stage],
+            })
+            for stage, total in self.totals.items()
+        )
 
-        self.broken_time = 0.0
-        self.broken_period = 4.0
-        self.broken_drift_time = 3.2
 
+def replay_frames(source, fps=10.0):
+    """
+    Yields (name, timestamp, BGRA frame) from a directory of images (sorted
+    by file name, `fps` apart) or a video file (needs opencv-python).
+    """
+    if os.path.isdir(source):
+        names = sorted(
+            f for f in os.listdir(source)
+            if f.lower().endswith((".png", ".jpg", ".jpeg", ".bmp"))
+        )
+        for i, name in enumerate(names):
+            with Image.open(os.path.join(source, name)) as img:
+                rgba = np.asarray(img.convert("RGBA"))
+            # same channel order as the mss grab
+            yield name, i / fps, np.ascontiguousarray(rgba[..., [2, 1, 0, 3]])
+        return
+
+    try:
+        import cv2
+    except Exception as e:
+        raise RuntimeError(f"video replay needs opencv-python: {e}")
+    cap = cv2.VideoCapture(source)
+    if not cap.isOpened():
+        raise RuntimeError(f"can't open {source}")
+    fps = cap.get(cv2.CAP_PROP_FPS) or fps
+    i = 0
+    try:
+        while True:
+            ok, bgr = cap.read()
+            if not ok:
+                break
+            yield str(i), i / fps, cv2.cvtColor(bgr, cv2.COLOR_BGR2BGRA)
+            i += 1
+    finally:
+        cap.release()
+
+
+def load_replay_labels(path):
+    """
+    Ground truth for --replay: one `<frame> <kind>` per expected event, where
+    frame is an image file name or a video frame index and kind is kill or
+    death. Blank lines and # comments are skipped.
+    """
+    labels = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.split("#", 1)[0].split()
+            if line:
+                labels.append((line[0], line[1] if len(line) > 1 else HIT_KILL))
+    return labels
+
+
+def score_replay(events, labels, order, slack=2):
+    """
+    Precision/recall of (frame, kind) events against labels. An event counts
+    if a label of the same kind is within `slack` frames of it.
+    """
+    pending = [(order[name], kind) for name, kind in labels if name in order]
+    tp = 0
+    for name, kind in events:
+        i = order[name]
+        for j, (li, lkind) in enumerate(pending):
+            if lkind == kind and abs(li - i) <= slack:
+                del pending[j]
+                tp += 1
+                break
+    precision = tp / len(events) if events else 1.0
+    recall = tp / len(labels) if labels else 1.0
+    return tp, precision, recall
+
+
+def replay(source, labels_path=None, fps=10.0, screen_width=1920, json_path=None):
+    """
+    Runs recorded frames through the watcher pipeline without a screen:
+    the same regions, gate, OCR backend, tracker and name matcher, with
+    `capture` being the image decode. Frames the size of the killfeed grab
+    are used as is, full screenshots are cropped to it. Peak traced memory
+    comes from a second pass under tracemalloc, so the timings are clean.
+    """
+    import json
+    import tracemalloc
+
+    backend = make_ocr_backend()
+    print("[replay] OCR backend:", backend.name)
+
+    def run(trace):
+        """One pass over the recording; the tracemalloc pass is separate so it doesn't skew the times."""
+        timer = StageTimer()
+        events = []
+
+        def on_hit(kind, snippet, t):
+            if not trace:
+                events.append((frame_name, kind))
+                print(f"[replay] {frame_name}: {kind} → {snippet[:80]}")
+
+        regions = RegionSet(build_capture_regions(screen_width, backend, on_hit))
+        if not trace:
+            instrument_regions(regions, timer)
+        m = regions.monitor
+
+        if trace:
+            tracemalloc.start()
+        order = {}
+        frame_name = None
+        frames = iter(replay_frames(source, fps))
+        t_start = time.perf_counter()
+        while True:
+            t0 = time.perf_counter()
+            frame_name, now, frame = next(frames, (None, None, None))
+            if frame is None:
+                break
+            if frame.shape[1] >= screen_width and frame.shape[1] > m["width"]:
+                frame = frame[m["top"]:m["top"] + m["height"], m["left"]:m["left"] + m["width"]]
+            timer.add("capture", time.perf_counter() - t0)
+            order[frame_name] = len(order)
+            regions.process(frame, now)
+        elapsed = time.perf_counter() - t_start
+        peak = 0
+        if trace:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        return timer, events, order, elapsed, peak
+
+    timer, events, order, elapsed, _ = run(trace=False)
+    peak = run(trace=True)[4]
+
+    n = len(order)
+    result = OrderedDict([
+        ("source", source),
+        ("backend", backend.name),
+        ("frames", n),
+        ("fps", n / elapsed if elapsed else 0.0),
+        ("stages", timer.report(n)),
+        ("events", len(events)),
+        ("peak_traced_mb", peak / 1e6),
+    ])
+    try:
+        import resource
+        # Linux reports KiB
+        result["max_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+    except ImportError:
+        pass
+
+    print(f"[replay] {n} frames, {result['fps']:.1f} frames/s, {len(events)} events")
+    for stage, st in result["stages"].items():
+        print(
+            f"[replay]   {stage:<10} {st['ms_per_frame']:8.3f} ms/frame"
+            f" {st['ms_per_call']:8.3f} ms/call ({st['calls']} calls)"
+        )
+    print(f"[replay] peak traced memory: {result['peak_traced_mb']:.1f} MB")
+    if "max_rss_mb" in result:
+        print(f"[replay] max RSS: {result['max_rss_mb']:.1f} MB")
+
+    if labels_path:
+        labels = load_replay_labels(labels_path)
+        tp, precision, recall = score_replay(events, labels, order)
+        result.update(precision=precision, recall=recall, true_positives=tp, labels=len(labels))
+        print(f"[replay] precision {precision:.3f} recall {recall:.3f} ({tp}/{len(labels)} labels)")
+
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+        print("[replay] wrote", json_path)
+    return result
+
+
+def make_font(spec):
+    family, size, bold = spec
+    if bold:
+        return QFont(family, size, QFont.Bold)
+    return QFont(family, size)
+
+
+class StylePool:
+    """
+    Shared QColor / QPen / QFont / QStaticText objects for the paint path.
+    - keyed by value: colour tuple, (colour, width), (family, size, bold)
+      font spec, (string, font spec)
+    - Qt shares these classes implicitly, so handing the same instance to
+      every painter is safe as long as nobody modifies it
+    - text() lays a string out once; draw_text() draws it baseline-anchored
+      like drawText
+    A table is emptied once it reaches max_entries (animated colours can
+    produce a lot of keys).
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.colors = {}
+        self.pens = {}
+        self.fonts = {}
+        self.metrics = {}
+        self.texts = {}
+
+    def _put(self, table, key, value):
+        if len(table) >= self.max_entries:
+            table.clear()
+        table[key] = value
+        return value
+
+    def color(self, rgba):
+        c = self.colors.get(rgba)
+        if c is None:
+            c = self._put(self.colors, rgba, QColor(*rgba))
+        return c
+
+    def pen(self, rgba, width=1):
+        key = (rgba, width)
+        pen = self.pens.get(key)
+        if pen is None:
+            pen = self._put(self.pens, key, QPen(self.color(rgba), width))
+        return pen
+
+    def font(self, spec):
+        f = self.fonts.get(spec)
+        if f is None:
+            f = self._put(self.fonts, spec, make_font(spec))
+        return f
+
+    def font_metrics(self, spec):
+        fm = self.metrics.get(spec)
+        if fm is None:
+            fm = self._put(self.metrics, spec, QFontMetrics(self.font(spec)))
+        return fm
+
+    def text(self, string, spec):
+        key = (string, spec)
+        st = self.texts.get(key)
+        if st is None:
+            st = QStaticText(string)
+            st.setTextFormat(Qt.PlainText)
+            st.prepare(QTransform(), self.font(spec))
+            self._put(self.texts, key, st)
+        return st
+
+    def draw_text(self, p: QPainter, x, y, string, spec):
+        p.setFont(self.font(spec))
+        p.drawStaticText(QPointF(x, y - self.font_metrics(spec).ascent()), self.text(string, spec))
+
+
+STYLES = StylePool()
+LABEL_FONT = ("Consolas", 10, False)
+QUOTE_FONT = ("Segoe UI", 20, True)
+
+
+def quantize(phase, steps=SPRITE_PHASE_STEPS):
+    """Periodic phase in [0, 1) -> integer step in [0, steps)."""
+    return int(round(phase * steps)) % steps
+
+
+class Curve:
+    """
+    A periodic animation curve (period 1) precomputed into a table.
+    - fn(t) is evaluated once, vectorised, on `samples` evenly spaced t in
+      [0, 1); it may return one value or a row of values per t
+    - curve.step(phase): the nearest sample to a phase in [0, 1), quantized
+      to this curve's own sample count
+    - curve[i]: sample i, for callers that already hold a step index
+    - curve.at(t): any t (wrapped), linear interpolation between samples
+    A lookup only pays off over math that needs several trig calls; a single
+    math.sin is faster than either lookup in CPython.
+    """
+
+    def __init__(self, fn, samples=SPRITE_PHASE_STEPS):
+        values = np.asarray(fn(np.arange(samples) / samples), dtype=np.float64)
+        values = np.broadcast_to(values, (samples,) + values.shape[1:])
+        self.samples = samples
+        self.array = values
+        self.values = [tuple(v) for v in values.tolist()] if values.ndim > 1 else values.tolist()
+
+    def __getitem__(self, step):
+        return self.values[step]
+
+    def step(self, phase):
+        return self.values[int(round(phase * self.samples)) % self.samples]
+
+    def at(self, t):
+        x = (t % 1.0) * self.samples
+        i = int(x)
+        a = self.values[i]
+        b = self.values[(i + 1) % self.samples]
+        f = x - i
+        if self.array.ndim > 1:
+            return tuple(va + (vb - va) * f for va, vb in zip(a, b))
+        return a + (b - a) * f
+
+
+EASINGS = {
+    "linear": lambda u: u,
+    "hold": lambda u: np.zeros_like(u),
+    "ease_in": lambda u: u * u,
+    "ease_out": lambda u: u * (2.0 - u),
+    "ease_in_out": lambda u: u * u * (3.0 - 2.0 * u),
+    "sine": lambda u: 0.5 - 0.5 * np.cos(np.pi * u),
+}
+
+
+def keyframes(keys, samples=SPRITE_PHASE_STEPS):
+    """
+    Declarative periodic Curve from [(t, value), (t, value, easing), ...]
+    with t in [0, 1). A key's easing (EASINGS name, default "linear")
+    shapes the segment that starts at it; after the last key the curve
+    runs back to the first one. Look it up with curve.step(phase) or
+    curve.at(phase).
+    """
+    keys = sorted((k[0], k[1], k[2] if len(k) > 2 else "linear") for k in keys)
+    starts = [k[0] for k in keys] + [keys[0][0] + 1.0]
+    values = [k[1] for k in keys] + [keys[0][1]]
+
+    def fn(t):
+        t = np.where(t < starts[0], t + 1.0, t)
+        out = np.empty_like(t)
+        seg = np.searchsorted(starts, t, side="right") - 1
+        for i, (_, _, easing) in enumerate(keys):
+            m = seg == i
+            u = (t[m] - starts[i]) / (starts[i + 1] - starts[i])
+            out[m] = values[i] + (values[i + 1] - values[i]) * EASINGS[easing](u)
+        return out
+
+    return Curve(fn, samples)
+
+
+
+
+class SpriteCache:
+    """
+    LRU cache of pre-rendered crosshair pieces (QPixmaps).
+    - key: anything hashable describing the piece (mode, scale, colour, phase step...)
+    - rect: (x, y, w, h) of the piece around its anchor point, or a callable
+      returning it (only evaluated on a miss)
+    - render(p): paints the piece in anchor coordinates, only called on a miss
+    Least recently used sprites are dropped once the cache passes max_bytes.
+    enabled=False paints straight through instead, for comparisons.
+    """
+
+    def __init__(self, max_bytes=SPRITE_CACHE_MB * 1024 * 1024, enabled=USE_SPRITES):
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.sprites = OrderedDict()
+        self.rects = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def rect(self, key, rect):
+        """Sprite rect around its anchor, without rendering it."""
+        entry = self.sprites.get(key)
+        if entry is not None:
+            pm, ox, oy = entry
+            return (ox, oy, pm.width(), pm.height())
+        if callable(rect):
+            cached = self.rects.get(key)
+            if cached is None:
+                cached = self.rects[key] = rect()
+            return cached
+        return rect
+
+    def _render(self, rect, render):
+        x, y, w, h = rect
+        pm = QPixmap(max(1, int(w)), max(1, int(h)))
+        pm.fill(Qt.transparent)
+        q = QPainter(pm)
+        q.setRenderHint(QPainter.Antialiasing)
+        q.translate(-x, -y)
+        render(q)
+        q.end()
+        return pm
+
+    def draw(self, p: QPainter, key, rect, render, x, y):
+        if not self.enabled:
+            p.save()
+            p.translate(x, y)
+            render(p)
+            p.restore()
+            return
+
+        entry = self.sprites.get(key)
+        if entry is None:
+            self.misses += 1
+            if callable(rect):
+                rect = self.rect(key, rect)
+            pm = self._render(rect, render)
+            entry = (pm, rect[0], rect[1])
+            self.sprites[key] = entry
+            self.rects.pop(key, None)   # the sprite knows its rect now
+            self.bytes += pm.width() * pm.height() * 4
+            while self.bytes > self.max_bytes and len(self.sprites) > 1:
+                _, (old, _, _) = self.sprites.popitem(last=False)
+                self.bytes -= old.width() * old.height() * 4
+        else:
+            self.hits += 1
+            self.sprites.move_to_end(key)
+
+        pm, ox, oy = entry
+        p.drawPixmap(int(round(x)) + ox, int(round(y)) + oy, pm)
+
+    def clear(self):
+        self.sprites.clear()
+        self.rects.clear()
+        self.bytes = 0
+
+
+class Frame:
+    """
+    Display list for one tick: the active mode records what it draws in
+    on_tick, paintEvent replays it.
+    - sprite(): a SpriteCache piece at an anchor point
+    - pixmap(): a ready-made QPixmap
+    - direct(): free-form painting covering a list of screen rects
+    `keys` identify the frame's pixels (equal keys = identical frames);
+    region() is the screen area it covers.
+    """
+
+    def __init__(self):
+        self.items = []
+        self.keys = []
+
+    def sprite(self, key, rect, render, x, y):
+        x = int(round(x))
+        y = int(round(y))
+        self.items.append(("sprite", key, rect, render, x, y))
+        self.keys.append((key, x, y))
+
+    def pixmap(self, x, y, pm):
+        self.items.append(("pixmap", None, None, pm, x, y))
+        self.keys.append((pm.cacheKey(), x, y))
+
+    def direct(self, key, rects, render):
+        self.items.append(("direct", key, rects, render, 0, 0))
+        self.keys.append(key)
+
+    def clear(self):
+        # keeps the lists' storage for the next tick
+        del self.items[:]
+        del self.keys[:]
+
+    def region(self, sprites):
+        region = QRegion()
+        for kind, key, rect, payload, x, y in self.items:
+            if kind == "sprite":
+                rx, ry, rw, rh = sprites.rect(key, rect)
+                region += QRect(x + rx, y + ry, rw, rh)
+            elif kind == "pixmap":
+                dpr = payload.devicePixelRatio()
+                region += QRect(x, y, int(math.ceil(payload.width() / dpr)),
+                                int(math.ceil(payload.height() / dpr)))
+            else:
+                for r in rect:
+                    region += QRect(*r)
+        return region
+
+    def replay(self, p: QPainter, sprites):
+        for kind, key, rect, payload, x, y in self.items:
+            if kind == "sprite":
+                sprites.draw(p, key, rect, payload, x, y)
+            elif kind == "pixmap":
+                p.drawPixmap(x, y, payload)
+            else:
+                p.save()
+                payload(p)
+                p.restore()
+
+
+CROSS_LINES = {}
+
+
+def cross_lines(length, gap):
+    """The four arms of a cross, built once per (length, gap); size comes from p.scale."""
+    lines = CROSS_LINES.get((length, gap))
+    if lines is None:
+        lines = CROSS_LINES[(length, gap)] = [
+            QLine(-gap - length, 0, -gap, 0),
+            QLine(gap, 0, gap + length, 0),
+            QLine(0, -gap - length, 0, -gap),
+            QLine(0, gap, 0, gap + length),
+        ]
+    return lines
+
+
+def paint_cross(p: QPainter, scale=1.0, length=12, gap=4,
+                thickness=2, color=(255, 255, 255)):
+    p.save()
+    p.scale(scale, scale)
+    p.setPen(STYLES.pen(color, thickness))
+    p.drawLines(cross_lines(length, gap))
+    p.drawEllipse(QPointF(0, 0), 2, 2)
+    p.restore()
+
+
+def draw_cross(p: Frame, cx: int, cy: int,
+               scale: float = 1.0,
+               length: int = 12,
+               gap: int = 4,
+               thickness: int = 2,
+               color=(255, 255, 255)):
+    scale = round(scale, 3)
+    e = int(math.ceil((gap + length + thickness) * scale)) + 2
+    p.sprite(
+        ("cross", scale, length, gap, thickness, color), (-e, -e, 2 * e, 2 * e),
+        lambda q: paint_cross(q, scale, length, gap, thickness, color),
+        cx, cy,
+    )
+
+
+def draw_circle_shape(p: Frame, cx: int, cy: int,
+                      radius: float = 10.0,
+                      thickness: int = 2):
+    def render(q):
+        q.setPen(STYLES.pen((255, 255, 255), thickness))
+        q.setBrush(Qt.NoBrush)
+        q.drawEllipse(QPointF(0, 0), radius, radius)
+
+    e = int(math.ceil(radius + thickness)) + 2
+    p.sprite(("circle", radius, thickness), (-e, -e, 2 * e, 2 * e), render, cx, cy)
+
+
+def draw_dot_shape(p: Frame, cx: int, cy: int,
+                   radius: float = 3.0,
+                   color=(255, 255, 255)):
+    def render(q):
+        q.setPen(Qt.NoPen)
+        q.setBrush(STYLES.color(color))
+        q.drawEllipse(QPointF(0, 0), radius, radius)
+
+    e = int(math.ceil(radius)) + 2
+    p.sprite(("dot", radius, color), (-e, -e, 2 * e, 2 * e), render, cx, cy)
+
+
+def draw_label(p: Frame, x, y, text, font=QUOTE_FONT,
+               color=(255, 255, 255, 255), shadow=None):
+    """Text anchored at its baseline like drawText; shadow = colour drawn at +2,+2."""
+    def render(q):
+        if shadow:
+            q.setPen(STYLES.pen(shadow))
+            STYLES.draw_text(q, 2, 2, text, font)
+        q.setPen(STYLES.pen(color))
+        STYLES.draw_text(q, 0, 0, text, font)
+
+    def rect():
+        r = STYLES.font_metrics(font).boundingRect(text)
+        return (r.x() - 2, r.y() - 2, r.width() + 6, r.height() + 6)
+
+    p.sprite(("text", text, font, color, shadow), rect, render, x, y)
+
+
+def draw_quote(p: Frame, cx, cy, text):
+    draw_label(p, cx + 100, cy + 8, text, shadow=(0, 0, 0, 220))
+
+
+def draw_pointer(p: Frame, cx, cy):
+    size = 26
+
+    def render(q):
+        q.setPen(STYLES.pen((0, 0, 0), 2))
+        q.setBrush(STYLES.color((255, 255, 255)))
+
+        tip = QPointF(0, 0)
+        bottom = QPointF(0, size)
+        right = QPointF(size * 0.5, size * 0.6)
+        q.drawPolygon(tip, bottom, right)
+
+    p.sprite(("pointer",), (-4, -4, size // 2 + 8, size + 8), render, cx, cy)
+
+
+MODES = {}
+
+
+def register_mode(cls):
+    """Class decorator: adds a Mode to the F9/killfeed cycle, in definition order."""
+    MODES[cls.name] = cls
+    return cls
+
+
+class Mode:
+    """
+    One crosshair mode. Only the active mode is ticked and painted.
+    - enter(): called when the mode becomes active (reset state here)
+    - tick(dt): advance the mode's own animation / physics
+    - paint(p): record this tick's drawing into a Frame
+    - bounds(frame): screen region the frame covers (dirty rects, window size)
+    - is_static(): True when the frame won't change unless the cursor moves
+      (or the mode changes); lets the overlay throttle its timer
+    - uses_cursor: False = cursor movement never changes the frame either,
+      so a static mode can stop the timer completely
+    Shared input (cursor_dx/dy, cursor_speed) lives on the overlay. Modes
+    declare their state in __slots__ and tick() only updates it in place;
+    paint() still builds small short-lived objects (render closures, sprite
+    keys), but nothing may accumulate from tick to tick (--check-alloc).
+    """
+
+    __slots__ = ("overlay",)
+    name = ""
+    uses_cursor = True
+
+    def __init__(self, overlay):
+        self.overlay = overlay
+
+    def enter(self):
+        pass
+
+    def tick(self, dt):
+        pass
+
+    def paint(self, p: Frame):
+        raise NotImplementedError
+
+    def bounds(self, frame):
+        return frame.region(self.overlay.sprites)
+
+    def is_static(self):
+        return False
+
+    def phase_steps(self, period):
+        """Sprite frames per cycle of a `period`-second animation: one per tick at the overlay's fps."""
+        return max(SPRITE_PHASE_STEPS, int(math.ceil(period * self.overlay.clock.fps)))
+
+
+@register_mode
+class StaticMode(Mode):
+    name = "static"
+    uses_cursor = False
+    __slots__ = ()
+
+    def is_static(self):
+        return True
+
+    def paint(self, p: Frame):
         
-        self.lag_trail = []          
-        self.lag_trail_len = 6
-        self.lag_offset = (0.0, 0.0)
+        draw_cross(p, self.overlay.center_x, self.overlay.center_y)
+
 
+@register_mode
+class ShakyMode(Mode):
+    name = "shaky"
+    __slots__ = ()
+
+    def paint(self, p: Frame):
         
-        self.heat = 0.0              
+        jitter = 3
+        cx = self.overlay.center_x + random.randint(-jitter, jitter)
+        cy = self.overlay.center_y + random.randint(-jitter, jitter)
+        draw_circle_shape(p, cx, cy, radius=6, thickness=2)
 
-   
-        self.mega_scale = 0.0        
 
-    
+@register_mode
+class OrbitBallMode(Mode):
+    name = "orbit_ball"
+    __slots__ = ("angle",)
+
+    def __init__(self, overlay):
+        super().__init__(overlay)
+        self.angle = 0.0
+
+    def tick(self, dt):
+        self.angle = (self.angle + 90.0 * dt) % 360.0
+
+    def paint(self, p: Frame):
+        cx, cy = self.overlay.center_x, self.overlay.center_y
+        radius = 35
+
+        # the ring is one fixed sprite; the ball is moved to its exact position
+        # (quarter-pixel variants), so it moves smoothly at any tick rate
+        p.sprite("orbit_ring", (-45, -45, 90, 90), self.render_ring, cx, cy)
+        a = math.radians(self.angle)
+        x = cx + math.cos(a) * radius
+        y = cy + math.sin(a) * radius
+        ix, iy = math.floor(x), math.floor(y)
+        fx = round((x - ix) * 4) / 4
+        fy = round((y - iy) * 4) / 4
+        p.sprite(("orbit_ball", fx, fy), (-9, -9, 20, 20),
+                 lambda q: self.render_ball(q, fx, fy), ix, iy)
+
+    @staticmethod
+    def render_ring(q):
+        q.setPen(STYLES.pen((255, 255, 255, 60), 1))
+        q.drawEllipse(QPointF(0, 0), 35, 35)
+
+    @staticmethod
+    def render_ball(q, fx, fy):
+        q.setPen(Qt.NoPen)
+        q.setBrush(STYLES.color((255, 255, 255)))
+        q.drawEllipse(QPointF(fx, fy), 7, 7)
+
+        q.setBrush(STYLES.color((0, 0, 0)))
+        q.drawEllipse(QPointF(fx + 2, fy - 1), 2, 2)
+
+
+@register_mode
+class CuteQuotesMode(Mode):
+    name = "cute_quotes"
+    __slots__ = ("quotes", "current_quote", "quote_timer", "quote_interval")
+
+    def __init__(self, overlay):
+        super().__init__(overlay)
         self.quotes = [
             "u can do it man!",
             "dont whiff this one",
@@ -119,55 +2016,45 @@ class CrosshairOverlay(QWidget):
             "they're scared of u",
             "one good round changes everything",
         ]
+        for q in self.quotes:
+            STYLES.text(q, QUOTE_FONT)
         self.current_quote = random.choice(self.quotes)
         self.quote_timer = 0.0
         self.quote_interval = random.uniform(4.0, 7.0)
 
-        
-        self.cute_pix = load_pixmap("cute_guy.png")
-        self.cute_pix_scaled = None
-        if self.cute_pix:
-            max_size = 260  
-            w = self.cute_pix.width()
-            h = self.cute_pix.height()
-            scale = min(max_size / float(max(w, h)), 1.0)
-            self.cute_pix_scaled = self.cute_pix.scaled(
-                int(w * scale),
-                int(h * scale),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation,
-            )
+    def tick(self, dt):
+        self.quote_timer += dt
+        if self.quote_timer >= self.quote_interval:
+            self.quote_timer = 0.0
+            self.current_quote = random.choice(self.quotes)
+            self.quote_interval = random.uniform(4.0, 7.0)
 
-        
-        self.angel_pix = load_pixmap("angel_guy.png")
-        self.devil_pix = load_pixmap("devil_guy.png")
-        self.angel_pix_scaled = None
-        self.devil_pix_scaled = None
-        max_ad_size = 200  
-        if self.angel_pix:
-            w = self.angel_pix.width()
-            h = self.angel_pix.height()
-            scale = min(max_ad_size / float(max(w, h)), 1.0)
-            self.angel_pix_scaled = self.angel_pix.scaled(
-                int(w * scale),
-                int(h * scale),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation,
-            )
-        if self.devil_pix:
-            w = self.devil_pix.width()
-            h = self.devil_pix.height()
-            scale = min(max_ad_size / float(max(w, h)), 1.0)
-            self.devil_pix_scaled = self.devil_pix.scaled(
-                int(w * scale),
-                int(h * scale),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation,
-            )
+    def paint(self, p: Frame):
+        o = self.overlay
+        cx, cy = o.center_x, o.center_y
 
-        self.ad_is_angel = True
-        self.ad_timer = 0.0
-        self.ad_interval = random.uniform(4.0, 8.0)
+        cute = o.asset("cute_guy.png")
+        if cute:
+            pm, w, h = cute
+            p.pixmap(cx - w // 2, cy - h // 2, pm)
+        else:
+            draw_dot_shape(p, cx, cy, radius=20)
+
+        draw_quote(p, cx, cy, self.current_quote)
+
+
+@register_mode
+class AngelDevilMode(Mode):
+    name = "angel_devil"
+    __slots__ = (
+        "is_angel", "timer", "interval", "angel_quotes", "devil_quotes", "current_quote",
+    )
+
+    def __init__(self, overlay):
+        super().__init__(overlay)
+        self.is_angel = True
+        self.timer = 0.0
+        self.interval = random.uniform(4.0, 8.0)
         self.angel_quotes = [
             "play smart :)",
             "just breathe and hold",
@@ -180,764 +2067,1455 @@ class CrosshairOverlay(QWidget):
             "knife him. do it.",
             "peek again. they won't expect it.",
         ]
-        self.ad_current_quote = random.choice(self.angel_quotes)
+        for q in self.angel_quotes + self.devil_quotes:
+            STYLES.text(q, QUOTE_FONT)
+        self.current_quote = random.choice(self.angel_quotes)
+
+    def tick(self, dt):
+        self.timer += dt
+        if self.timer >= self.interval:
+            self.timer = 0.0
+            self.interval = random.uniform(4.0, 8.0)
+            self.is_angel = random.choice([True, False])
+            if self.is_angel:
+                self.current_quote = random.choice(self.angel_quotes)
+            else:
+                self.current_quote = random.choice(self.devil_quotes)
 
-        
-        self.duck_pix = load_pixmap("duck_guy.png")
-        self.duck_pix_scaled = None
-        if self.duck_pix:
-            max_duck = 200  
-            w = self.duck_pix.width()
-            h = self.duck_pix.height()
-            scale = min(max_duck / float(max(w, h)), 1.0)
-            self.duck_pix_scaled = self.duck_pix.scaled(
-                int(w * scale),
-                int(h * scale),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation,
-            )
+    def paint(self, p: Frame):
+        o = self.overlay
+        cx, cy = o.center_x, o.center_y
 
-        
+        guy = o.asset("angel_guy.png" if self.is_angel else "devil_guy.png")
+        if guy:
+            pm, w, h = guy
+            p.pixmap(cx - w // 2, cy - h // 2, pm)
+        else:
+            draw_dot_shape(p, cx, cy, radius=20)
+
+        draw_quote(p, cx, cy, self.current_quote)
+
+
+@register_mode
+class DuckMode(Mode):
+    """
+    Duck crosshair:
+    - Little duck PNG bobbing up/down
+    - Slight squish based on mouse speed (a few pre-scaled sizes)
+    """
+
+    name = "duck"
+    __slots__ = ("phase",)
+    # up to 10% bigger at full mouse speed
+    scales = [1.0 + 0.1 * i / DUCK_SQUISH_STEPS for i in range(DUCK_SQUISH_STEPS + 1)]
+
+    def __init__(self, overlay):
+        super().__init__(overlay)
+        self.phase = 0.0
+
+    def tick(self, dt):
+        self.phase = (self.phase + 2.0 * dt) % (2 * math.pi)
+
+    def paint(self, p: Frame):
+        o = self.overlay
+        cx, cy = o.center_x, o.center_y
+        # squish quantised to DUCK_SQUISH_STEPS sizes, each pre-scaled by the AssetCache
+        k = int(round(min(o.cursor_speed / 50.0, 1.0) * DUCK_SQUISH_STEPS))
+        duck = o.asset("duck_guy.png", self.scales[k])
+
+        if duck:
+            pm, w, h = duck
+            bob = int(math.sin(self.phase) * 10)
+            p.pixmap(cx - w // 2, cy + bob - h // 2, pm)
+        else:
+            draw_dot_shape(p, cx, cy, radius=20, color=(255, 255, 0))
+
+
+@register_mode
+class SleepyMode(Mode):
+    """
+    Sleepy: drooping cross + Zzz
+    (we can convert this to a pillow icon later if you want)
+    """
+
+    name = "sleepy"
+    __slots__ = (
+        "windows_pointer_duration", "sleep_progress", "idle_time", "windows_pointer_timer",
+    )
+
+    def __init__(self, overlay):
+        super().__init__(overlay)
+        self.windows_pointer_duration = 1.5
+        self.enter()
+
+    def enter(self):
         self.sleep_progress = 0.0
         self.idle_time = 0.0
         self.windows_pointer_timer = 0.0
-        self.windows_pointer_duration = 1.5
 
+    def wake(self):
         
-        self.cursor_speed = 0.0
-        self.last_cursor_pos = None
+        self.sleep_progress = 0.0
+        self.idle_time = 0.0
+        self.windows_pointer_timer = self.windows_pointer_duration
 
-        
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.on_tick)
-        self.timer.start(int(self.dt * 1000))
+    def tick(self, dt):
+        if self.windows_pointer_timer > 0.0:
+            self.windows_pointer_timer = max(
+                0.0, self.windows_pointer_timer - dt
+            )
+        else:
+            if self.overlay.cursor_speed < 2.0:
+                self.idle_time += dt
+            else:
+                self.idle_time = 0.0
+                self.sleep_progress = max(0.0, self.sleep_progress - dt * 0.4)
 
-        print("[overlay] started. Modes:", self.modes)
+            if self.idle_time > 2.0:
+                self.sleep_progress = min(
+                    1.0, self.sleep_progress + dt / 2.5
+                )
 
-        self._start_ocr_watcher()
-        self._start_hotkey_listener()
-        self._start_mouse_listener()
+    def is_static(self):
+        # fully asleep and the mouse is still: only idle_time keeps counting
+        return (
+            self.windows_pointer_timer == 0.0
+            and self.sleep_progress >= 1.0
+            and self.overlay.cursor_speed < 2.0
+        )
 
-   
-    def _start_hotkey_listener(self):
-        def worker():
-            try:
-                import keyboard
-            except Exception as e:
-                print("[overlay] keyboard import failed, hotkey disabled:", e)
-                return
-            try:
-                keyboard.add_hotkey(HOTKEY_KEY, lambda: self._cycle_mode("hotkey"))
-                keyboard.wait()
-            except Exception as e:
-                print("[overlay] keyboard listener error:", e)
+    def paint(self, p: Frame):
+        cx, cy = self.overlay.center_x, self.overlay.center_y
 
-        t = threading.Thread(target=worker, daemon=True)
-        t.start()
+        if self.windows_pointer_timer > 0.0:
+            draw_pointer(p, cx, cy)
+            return
 
-    
-    def _start_mouse_listener(self):
-        def worker():
-            try:
-                import mouse
-            except Exception as e:
-                print("[overlay] mouse import failed, sleepy wake disabled:", e)
-                return
-            try:
-                mouse.on_right_click(lambda: self._on_right_click())
-                mouse.wait()
-            except Exception as e:
-                print("[overlay] mouse listener error:", e)
+        droop = int(self.sleep_progress * 45.0)
+        draw_cross(p, cx, cy + droop)
 
-        t = threading.Thread(target=worker, daemon=True)
-        t.start()
+        if self.sleep_progress > 0.95:
+            draw_label(p, cx + 20, cy - 30, "Zzz", ("Segoe UI", 16, True), (255, 255, 255, 200))
 
-    def _on_right_click(self):
-        if self.current_mode == "sleepy":
-            
-            self.sleep_progress = 0.0
-            self.idle_time = 0.0
-            self.windows_pointer_timer = self.windows_pointer_duration
-            print("[overlay] sleepy wake: right-click")
 
-    
-    def _start_ocr_watcher(self):
-        def worker():
-            print("[overlay] OCR watching...")
+@register_mode
+class PointerMode(Mode):
+    name = "pointer"
+    uses_cursor = False
+    __slots__ = ()
 
-            monitor = {
-                "left": int(self.screen_width - 700),
-                "top": 30,
-                "width": 700,
-                "height": 320,
-            }
-            print("[overlay] OCR region:", monitor)
+    def is_static(self):
+        return True
 
-            while True:
-                try:
-                    with mss.mss() as sct:
-                        while True:
-                            try:
-                                img = sct.grab(monitor)
-                                arr = np.array(img)[..., :3]
-
-                                pil_img = Image.fromarray(arr)
-                                proc = self._preprocess_for_ocr(pil_img)
-
-                                text = pytesseract.image_to_string(
-                                    proc,
-                                    config="--psm 6 --oem 3",
-                                ).lower()
-
-                                if any(k in text for k in [
-                                    "dieselderek",
-                                    "diesel",
-                                    "derek",
-                                    "derke",
-                                ]):
-                                    snippet = text.replace("\n", " ").strip()
-                                    now = time.time()
-
-                                    
-                                    if snippet and (
-                                        snippet != self.last_killfeed_snippet
-                                        or now - self.last_killfeed_time > 2.5
-                                    ):
-                                        self.last_killfeed_snippet = snippet
-                                        self.last_killfeed_time = now
-                                        print("[overlay] killfeed match →", snippet[:80])
-                                        self.pending_name_hit = True
-
-                                time.sleep(0.25)
-
-                            except Exception as frame_err:
-                                print("[OCR] frame error:", frame_err)
-                                time.sleep(0.5)
-                                break
-                except Exception as outer_err:
-                    print("[OCR] outer error, retrying:", outer_err)
-                    time.sleep(1.0)
+    def paint(self, p: Frame):
+        draw_pointer(p, self.overlay.center_x, self.overlay.center_y)
 
-        t = threading.Thread(target=worker, daemon=True)
-        t.start()
 
-    def _preprocess_for_ocr(self, pil_img):
-        w, h = pil_img.size
-        pil_img = pil_img.crop((0, int(h * 0.15), w, int(h * 0.85)))
-        img = pil_img.convert("L")
-        img = ImageOps.autocontrast(img)
+SPOKE_TABLES = {}
 
-        def thresh(x):
-            return 255 if x > 160 else 0
 
-        img = img.point(thresh, mode="L")
-        img = img.resize((img.width * 2, img.height * 2), Image.BICUBIC)
-        return img
+def spoke_lines(step, spokes, inner_r, outer_r, steps=SPRITE_PHASE_STEPS):
+    """
+    `spokes` evenly spaced radial QLines, rotated by step / steps of the gap
+    between two spokes. All steps are computed in one NumPy pass on first use.
+    """
+    key = (spokes, inner_r, outer_r, steps)
+    table = SPOKE_TABLES.get(key)
+    if table is None:
+        sector = 2 * math.pi / spokes
+        ang = (sector * np.arange(steps) / steps)[:, None] + sector * np.arange(spokes)
+        c, s = np.cos(ang), np.sin(ang)
+        ends = np.floor(np.stack([c * inner_r, s * inner_r, c * outer_r, s * outer_r], axis=-1))
+        table = SPOKE_TABLES[key] = [
+            [QLine(*v) for v in row] for row in ends.astype(int).tolist()
+        ]
+    return table[step]
 
-    
-    def _cycle_mode(self, reason=""):
-        prev = self.current_mode
-        self.mode_index = (self.mode_index + 1) % len(self.modes)
-        self.current_mode = self.modes[self.mode_index]
-        print(f"[overlay] mode: {prev} → {self.current_mode} ({reason})")
 
-        
-        if self.current_mode != "sleepy":
-            self.sleep_progress = 0.0
-            self.idle_time = 0.0
-            self.windows_pointer_timer = 0.0
+@register_mode
+class BlackholeMode(Mode):
+    name = "blackhole"
+    __slots__ = ("phase",)
 
-        if self.current_mode != "jelly":
-            self.jelly_scale = 1.0
-            self.jelly_vel = 0.0
+    def __init__(self, overlay):
+        super().__init__(overlay)
+        self.phase = 0.0
 
-        if self.current_mode != "broken":
-            self.broken_time = 0.0
+    def tick(self, dt):
+        self.phase = (self.phase + 1.5 * dt) % (2 * math.pi)
 
-        if self.current_mode != "mega_cross":
-            self.mega_scale = 0.0  
+    def paint(self, p: Frame):
+        cx, cy = self.overlay.center_x, self.overlay.center_y
+        spokes = 6
+        max_r = 55
 
-   
-    def on_tick(self):
-        dt = self.dt
+        # spokes are 6-fold symmetric, so only 1/6 of a turn needs frames
+        sector = 2 * math.pi / spokes
+        steps = self.phase_steps(sector / 1.5)
+        step = quantize((self.phase % sector) / sector, steps)
 
-        
-        if self.pending_name_hit:
-            self.pending_name_hit = False
-            self._cycle_mode("killfeed")
+        def render(q):
+            
+            paint_cross(q)
 
-        
-        self.orbit_angle = (self.orbit_angle + 90.0 * dt) % 360.0
-        self.blackhole_phase = (self.blackhole_phase + 1.5 * dt) % (2 * math.pi)
-        self.panic_phase = (self.panic_phase + dt) % 1.0
-        self.duck_phase = (self.duck_phase + 2.0 * dt) % (2 * math.pi)
-        self.metronome_time += dt
+            q.setPen(Qt.NoPen)
 
-        
-        dx = dy = 0.0
-        try:
-            pos = QCursor.pos()
-            if self.last_cursor_pos is not None:
-                dx = pos.x() - self.last_cursor_pos.x()
-                dy = pos.y() - self.last_cursor_pos.y()
-                dist = math.hypot(dx, dy)
-                self.cursor_speed = self.cursor_speed * 0.8 + dist * 0.2
-            self.last_cursor_pos = pos
-        except Exception:
-            pass
+            for i in range(4):
+                t = i / 4.0
+                r = max_r * (1.0 - 0.18 * i)
+                alpha = int(150 * (1.0 - t))
+                q.setBrush(STYLES.color((10, 10, 15, alpha)))
+                q.drawEllipse(QPointF(0, 0), r, r)
 
-        
-        ox, oy = self.lag_offset
-        if dx != 0.0 or dy != 0.0:
-            factor = 0.4
-            ox = ox * 0.8 - dx * factor
-            oy = oy * 0.8 - dy * factor
-        else:
-            ox = ox * 0.85
-            oy = oy * 0.85
-        self.lag_offset = (ox, oy)
-        self.lag_trail.insert(0, (ox, oy))
-        self.lag_trail = self.lag_trail[:self.lag_trail_len]
+            q.setBrush(STYLES.color((0, 0, 0, 230)))
+            q.drawEllipse(QPointF(0, 0), 9, 9)
 
-        
-        self.heat += (self.cursor_speed / 800.0) * dt   
-        self.heat -= 0.3 * dt                           
-        self.heat = max(0.0, min(self.heat, 1.0))
+            q.setPen(STYLES.pen((255, 255, 255, 210), 2))
+            q.drawLines(spoke_lines(step, spokes, 14, max_r, steps))
 
-        
-        if self.current_mode == "mega_cross":
-            self.mega_scale += dt * 0.02  
-        
+        e = max_r + 3
+        p.sprite(("blackhole", steps, step), (-e, -e, 2 * e, 2 * e), render, cx, cy)
 
-        
-        if self.current_mode == "sleepy":
-            if self.windows_pointer_timer > 0.0:
-                self.windows_pointer_timer = max(
-                    0.0, self.windows_pointer_timer - dt
-                )
-            else:
-                if self.cursor_speed < 2.0:
-                    self.idle_time += dt
-                else:
-                    self.idle_time = 0.0
-                    self.sleep_progress = max(0.0, self.sleep_progress - dt * 0.4)
 
-                if self.idle_time > 2.0:
-                    self.sleep_progress = min(
-                        1.0, self.sleep_progress + dt / 2.5
-                    )
-        else:
-            self.idle_time = 0.0
-            self.sleep_progress = 0.0
-            self.windows_pointer_timer = 0.0
+@register_mode
+class PanicMode(Mode):
+    """
+    Panic: big heartbeat crosshair
+    """
 
-        
-        target = 1.0 + min(self.cursor_speed / 40.0, 1.0) * 0.6
-        k = 10.0
-        d = 8.0
-        self.jelly_vel += (target - self.jelly_scale) * k * dt
-        self.jelly_vel -= self.jelly_vel * d * dt
-        self.jelly_scale += self.jelly_vel * dt
-        self.jelly_scale = max(0.6, min(self.jelly_scale, 1.8))
+    name = "panic"
+    __slots__ = ("phase",)
 
-        
-        self.broken_time += dt
-        if self.broken_time > self.broken_period:
-            self.broken_time = 0.0
+    def __init__(self, overlay):
+        super().__init__(overlay)
+        self.phase = 0.0
 
-        
-        self.quote_timer += dt
-        if self.quote_timer >= self.quote_interval:
-            self.quote_timer = 0.0
-            self.current_quote = random.choice(self.quotes)
-            self.quote_interval = random.uniform(4.0, 7.0)
+    def tick(self, dt):
+        self.phase = (self.phase + dt) % 1.0
 
-        
-        self.ad_timer += dt
-        if self.ad_timer >= self.ad_interval:
-            self.ad_timer = 0.0
-            self.ad_interval = random.uniform(4.0, 8.0)
-            self.ad_is_angel = random.choice([True, False])
-            if self.ad_is_angel:
-                self.ad_current_quote = random.choice(self.angel_quotes)
-            else:
-                self.ad_current_quote = random.choice(self.devil_quotes)
+    def paint(self, p: Frame):
+        o = self.overlay
+        speed_factor = 1.0 + min(o.cursor_speed / 40.0, 1.0) * 2.0
+        # one beat a second at rest (faster beats just skip steps)
+        steps = self.phase_steps(1.0)
+        step = quantize((self.phase * speed_factor) % 1.0, steps)
+        scale = 1.0 + 0.25 * math.sin(2 * math.pi * step / steps)
+        draw_cross(p, o.center_x, o.center_y, scale=scale * 1.4, length=18, gap=6, thickness=3)
 
-        self.update()
 
-    
-    def paintEvent(self, e):
-        p = QPainter(self)
-        p.setRenderHint(QPainter.Antialiasing)
+@register_mode
+class JellyMode(Mode):
+    """
+    Jelly: breathing ring instead of cross
+    """
 
-        mode = self.current_mode
-        try:
-            if mode == "static":
-                self.draw_static(p)
-            elif mode == "shaky":
-                self.draw_shaky(p)
-            elif mode == "orbit_ball":
-                self.draw_orbit_ball(p)
-            elif mode == "cute_quotes":
-                self.draw_cute(p)
-            elif mode == "angel_devil":
-                self.draw_angel_devil(p)
-            elif mode == "duck":
-                self.draw_duck(p)
-            elif mode == "sleepy":
-                self.draw_sleepy(p)
-            elif mode == "pointer":
-                self.draw_pointer(p)
-            elif mode == "blackhole":
-                self.draw_blackhole(p)
-            elif mode == "panic":
-                self.draw_panic(p)
-            elif mode == "jelly":
-                self.draw_jelly(p)
-            elif mode == "broken":
-                self.draw_broken(p)
-            elif mode == "lag_echo":
-                self.draw_lag_echo(p)
-            elif mode == "focus_window":
-                self.draw_focus_window(p)
-            elif mode == "overheated":
-                self.draw_overheated(p)
-            elif mode == "metronome":
-                self.draw_metronome(p)
-            elif mode == "mega_cross":
-                self.draw_mega_cross(p)
-        except Exception as err:
-            print("[overlay] draw error:", err)
-            self.draw_static(p)
+    name = "jelly"
+    __slots__ = ("scale", "vel")
 
-        
-        p.setPen(QPen(QColor(0, 0, 0, 180)))
-        p.setFont(QFont("Consolas", 10))
-        p.drawText(10, 20, self.current_mode)
+    def __init__(self, overlay):
+        super().__init__(overlay)
+        self.enter()
 
-        p.end()
-    
-    def draw_cross(self, p: QPainter, cx: int, cy: int,
-                   scale: float = 1.0,
-                   length: int = 12,
-                   gap: int = 4,
-                   thickness: int = 2):
-        p.save()
-        p.translate(cx, cy)
-        p.scale(scale, scale)
-        p.setPen(QPen(QColor(255, 255, 255), thickness))
+    def enter(self):
+        self.scale = 1.0
+        self.vel = 0.0
 
-        
-        p.drawLine(-gap - length, 0, -gap, 0)
-        p.drawLine(gap, 0, gap + length, 0)
-        
-        p.drawLine(0, -gap - length, 0, -gap)
-        p.drawLine(0, gap, 0, gap + length)
-
-        p.drawEllipse(QPointF(0, 0), 2, 2)
-        p.restore()
-
-    def draw_circle_shape(self, p: QPainter, cx: int, cy: int,
-                          radius: float = 10.0,
-                          thickness: int = 2):
-        p.save()
-        p.setPen(QPen(QColor(255, 255, 255), thickness))
-        p.setBrush(Qt.NoBrush)
-        p.drawEllipse(QPointF(cx, cy), radius, radius)
-        p.restore()
-
-    def draw_dot_shape(self, p: QPainter, cx: int, cy: int,
-                       radius: float = 3.0):
-        p.save()
-        p.setPen(Qt.NoPen)
-        p.setBrush(QColor(255, 255, 255))
-        p.drawEllipse(QPointF(cx, cy), radius, radius)
-        p.restore()
+    def tick(self, dt):
+        target = 1.0 + min(self.overlay.cursor_speed / 40.0, 1.0) * 0.6
+        k = 10.0
+        d = 8.0
+        self.vel += (target - self.scale) * k * dt
+        self.vel -= self.vel * d * dt
+        self.scale += self.vel * dt
+        self.scale = max(0.6, min(self.scale, 1.8))
+
+    def is_static(self):
+        # settled back at rest size (cursor_speed only decays towards 0)
+        return (
+            self.overlay.cursor_speed < 0.05
+            and abs(self.vel) < 1e-3
+            and abs(self.scale - 1.0) < 1e-3
+        )
 
-    
-    def draw_static(self, p: QPainter):
-        
-        self.draw_cross(p, self.center_x, self.center_y)
+    def paint(self, p: Frame):
+        # quarter-pixel radius steps keep the ring frames cacheable
+        radius = round(40.0 * self.scale) / 4.0
+        draw_circle_shape(p, self.overlay.center_x, self.overlay.center_y,
+                          radius=radius, thickness=3)
 
-    def draw_shaky(self, p: QPainter):
-        
-        jitter = 3
-        cx = self.center_x + random.randint(-jitter, jitter)
-        cy = self.center_y + random.randint(-jitter, jitter)
-        self.draw_circle_shape(p, cx, cy, radius=6, thickness=2)
 
-    def draw_orbit_ball(self, p: QPainter):
-        cx, cy = self.center_x, self.center_y
+@register_mode
+class BrokenMode(Mode):
+    name = "broken"
+    __slots__ = ("period", "drift_time", "time")
 
-        p.setPen(QPen(QColor(255, 255, 255, 60), 1))
-        radius = 35
-        p.drawEllipse(QPointF(cx, cy), radius, radius)
+    def __init__(self, overlay):
+        super().__init__(overlay)
+        self.period = 4.0
+        self.drift_time = 3.2
+        self.enter()
 
-        a = math.radians(self.orbit_angle)
-        x = cx + math.cos(a) * radius
-        y = cy + math.sin(a) * radius
+    def enter(self):
+        self.time = 0.0
 
-        p.setPen(Qt.NoPen)
-        p.setBrush(QColor(255, 255, 255))
-        p.drawEllipse(QPointF(x, y), 7, 7)
+    def tick(self, dt):
+        self.time += dt
+        if self.time > self.period:
+            self.time = 0.0
 
-        p.setBrush(QColor(0, 0, 0))
-        p.drawEllipse(QPointF(x + 2, y - 1), 2, 2)
+    def paint(self, p: Frame):
+        t = self.time
+        max_offset = 10
 
-    def draw_cute(self, p: QPainter):
-        cx, cy = self.center_x, self.center_y
+        if t <= self.drift_time:
+            offset = int(max_offset * (t / self.drift_time))
+        else:
+            offset = max_offset
 
-        if self.cute_pix_scaled:
-            w = self.cute_pix_scaled.width()
-            h = self.cute_pix_scaled.height()
-            p.drawPixmap(cx - w // 2, cy - h // 2, self.cute_pix_scaled)
+        draw_cross(p, self.overlay.center_x, self.overlay.center_y,
+                   gap=4 + offset, length=12, thickness=2)
+
+
+@register_mode
+class LagEchoMode(Mode):
+    """
+    Lagging crosshair:
+    - main dot at center
+    - trailing faint ghosts based on mouse movement
+    """
+
+    name = "lag_echo"
+    __slots__ = (
+        "trail_len", "trail_x", "trail_y", "trail_head", "trail_count", "trail_time",
+        "offset_x", "offset_y",
+    )
+
+    def __init__(self, overlay):
+        super().__init__(overlay)
+        self.trail_len = 6
+        # ring buffer of past offsets, newest at trail_head
+        self.trail_x = array("d", [0.0] * self.trail_len)
+        self.trail_y = array("d", [0.0] * self.trail_len)
+        self.trail_head = 0
+        self.trail_count = 0
+        self.trail_time = 0.0   # time since the newest ghost was started, minus half a step
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+
+    def tick(self, dt):
+        dx = self.overlay.cursor_dx
+        dy = self.overlay.cursor_dy
+        ox, oy = self.offset_x, self.offset_y
+        # tuned per PHYSICS_DT: n of those steps in this tick, movement spread over them
+        n = max(dt / PHYSICS_DT, 1e-6)
+        if dx != 0.0 or dy != 0.0:
+            keep = 0.8 ** n
+            factor = 0.4 * (1.0 - keep) / (0.2 * n)
+            ox = ox * keep - dx * factor
+            oy = oy * keep - dy * factor
         else:
-            p.setPen(Qt.NoPen)
-            p.setBrush(QColor(255, 255, 255))
-            p.drawEllipse(QPointF(cx, cy), 20, 20)
+            keep = 0.85 ** n
+            ox = ox * keep
+            oy = oy * keep
+        self.offset_x, self.offset_y = ox, oy
+
+        # a new ghost every PHYSICS_DT, so the trail spans the same time at any
+        # tick rate: a long tick starts several, spread from the previous offset
+        # to this one; the newest follows the offset in between. The half-step
+        # bias keeps 60 fps tick jitter from alternating 0 and 2 new ghosts.
+        self.trail_time += dt
+        n = int(self.trail_time / PHYSICS_DT + 0.5)
+        if n:
+            self.trail_time -= n * PHYSICS_DT
+            head = self.trail_head
+            px, py = self.trail_x[head], self.trail_y[head]
+            for i in range(max(1, n - self.trail_len + 1), n + 1):
+                head = (self.trail_head - i) % self.trail_len
+                f = i / n
+                self.trail_x[head] = px + (ox - px) * f
+                self.trail_y[head] = py + (oy - py) * f
+            self.trail_head = head
+            self.trail_count = min(self.trail_count + n, self.trail_len)
+        self.trail_x[self.trail_head] = ox
+        self.trail_y[self.trail_head] = oy
+
+    def is_static(self):
+        return abs(self.offset_x) < 0.05 and abs(self.offset_y) < 0.05
+
+    def paint(self, p: Frame):
+        cx, cy = self.overlay.center_x, self.overlay.center_y
 
-        text = self.current_quote
-        p.setFont(QFont("Segoe UI", 20, QFont.Bold))
+       
+        draw_dot_shape(p, cx, cy, radius=4)
 
-        tx = cx + 100
-        ty = cy + 8
+        n = self.trail_count
+        for i in range(n):
+            j = (self.trail_head + i) % self.trail_len
+            alpha = int(160 * (1.0 - i / max(1, n)))
+            radius = max(2, 4 - i)
+            draw_dot_shape(p, cx + self.trail_x[j], cy + self.trail_y[j], radius=radius,
+                           color=(255, 255, 255, max(0, alpha)))
+
+
+@register_mode
+class FocusWindowMode(Mode):
+    """
+    Focus window: camera viewfinder corners + blinking REC dot
+    """
+
+    name = "focus_window"
+    __slots__ = ("blink_phase", "corners")
+    half_size = 20
+    corner_len = 10
+
+    def __init__(self, overlay):
+        super().__init__(overlay)
+        self.blink_phase = 0.0
+
+        # all eight corner strokes, submitted with one drawLines
+        s = self.half_size
+        c = self.corner_len
+        self.corners = [
+            QLine(-s, -s, -s + c, -s), QLine(-s, -s, -s, -s + c),
+            QLine(s, -s, s - c, -s), QLine(s, -s, s, -s + c),
+            QLine(-s, s, -s + c, s), QLine(-s, s, -s, s - c),
+            QLine(s, s, s - c, s), QLine(s, s, s, s - c),
+        ]
 
-        p.setPen(QPen(QColor(0, 0, 0, 220), 3))
-        p.drawText(tx + 2, ty + 2, text)
+    def tick(self, dt):
+        self.blink_phase = (self.blink_phase + dt) % 1.0
 
-        p.setPen(QPen(QColor(255, 255, 255, 255), 1))
-        p.drawText(tx, ty, text)
+    def paint(self, p: Frame):
+        cx, cy = self.overlay.center_x, self.overlay.center_y
 
-    def draw_angel_devil(self, p: QPainter):
-        cx, cy = self.center_x, self.center_y
+        s = self.half_size
+        blink_on = self.blink_phase < 0.5
 
-        pm = self.angel_pix_scaled if self.ad_is_angel else self.devil_pix_scaled
-        if pm:
-            w = pm.width()
-            h = pm.height()
-            p.drawPixmap(cx - w // 2, cy - h // 2, pm)
-        else:
-            p.setPen(Qt.NoPen)
-            p.setBrush(QColor(255, 255, 255))
-            p.drawEllipse(QPointF(cx, cy), 20, 20)
+        def render(q):
+            q.setPen(STYLES.pen((255, 255, 255), 2))
+            q.setBrush(Qt.NoBrush)
+            q.drawLines(self.corners)
 
-        text = self.ad_current_quote
-        p.setFont(QFont("Segoe UI", 20, QFont.Bold))
+            
+            if blink_on:
+                q.setPen(Qt.NoPen)
+                q.setBrush(STYLES.color((255, 80, 80, 220)))
+                rec_x = s + 18
+                rec_y = -s - 2
+                q.drawEllipse(QPointF(rec_x, rec_y), 4, 4)
 
-        tx = cx + 100
-        ty = cy + 8
+                q.setPen(STYLES.pen((255, 255, 255, 220), 1))
+                STYLES.draw_text(q, rec_x + 8, rec_y + 3, "REC", ("Consolas", 9, False))
 
-        p.setPen(QPen(QColor(0, 0, 0, 220), 3))
-        p.drawText(tx + 2, ty + 2, text)
+        e = s + 2
+        p.sprite(("focus_window", blink_on), (-e, -e - 16, 2 * e + 70, 2 * e + 16),
+                 render, cx, cy)
 
-        p.setPen(QPen(QColor(255, 255, 255, 255), 1))
-        p.drawText(tx, ty, text)
 
-    def draw_duck(self, p: QPainter):
-        """
-        Duck crosshair:
-        - Little duck PNG bobbing up/down
-        - Slight squish based on mouse speed
-        """
-        cx, cy = self.center_x, self.center_y
+@register_mode
+class OverheatedMode(Mode):
+    """
+    Overheated crosshair:
+    - color + shake + size based on heat value (0..1)
+    """
 
-        if self.duck_pix_scaled:
-            w = self.duck_pix_scaled.width()
-            h = self.duck_pix_scaled.height()
+    name = "overheated"
+    __slots__ = ("heat",)
 
-            
-            bob_amp = 10
-            bob = int(math.sin(self.duck_phase) * bob_amp)
+    def __init__(self, overlay):
+        super().__init__(overlay)
+        self.heat = 0.0
 
-            
-            speed_factor = min(self.cursor_speed / 50.0, 1.0)
-            scale = 1.0 + 0.1 * speed_factor
+    def tick(self, dt):
+        self.heat += (self.overlay.cursor_speed / 800.0) * dt   
+        self.heat -= 0.3 * dt                           
+        self.heat = max(0.0, min(self.heat, 1.0))
 
-            p.save()
-            p.translate(cx, cy + bob)
-            p.scale(scale, scale)
-            p.drawPixmap(-w // 2, -h // 2, self.duck_pix_scaled)
-            p.restore()
-        else:
-            p.setPen(Qt.NoPen)
-            p.setBrush(QColor(255, 255, 0))
-            p.drawEllipse(QPointF(cx, cy), 20, 20)
+    def paint(self, p: Frame):
+        cx, cy = self.overlay.center_x, self.overlay.center_y
 
-    def draw_sleepy(self, p: QPainter):
-        """
-        Sleepy: drooping cross + Zzz
-        (we can convert this to a pillow icon later if you want)
-        """
-        cx, cy = self.center_x, self.center_y
+        heat = round(self.heat * SPRITE_PHASE_STEPS) / SPRITE_PHASE_STEPS
+        
+        r = 255
+        g = int(255 * (1.0 - 0.7 * heat))
+        b = int(255 * (1.0 - 0.9 * heat))
 
-        if self.windows_pointer_timer > 0.0:
-            self.draw_pointer(p)
-            return
+        
+        shake = 1.0 + 4.0 * heat
+        jitter_x = random.uniform(-shake, shake)
+        jitter_y = random.uniform(-shake, shake)
 
-        droop = int(self.sleep_progress * 45.0)
-        self.draw_cross(p, cx, cy + droop)
+        
+        scale = 1.0 + 0.6 * heat
 
-        if self.sleep_progress > 0.95:
-            p.setPen(QPen(QColor(255, 255, 255, 200)))
-            p.setFont(QFont("Segoe UI", 16, QFont.Bold))
-            p.drawText(cx + 20, cy - 30, "Zzz")
+        draw_cross(p, cx + jitter_x, cy + jitter_y, scale=scale,
+                   length=14, gap=5, thickness=3, color=(r, g, b))
 
-    def draw_pointer(self, p: QPainter):
-        cx, cy = self.center_x, self.center_y
-        size = 26
+        
+        if heat > 0.75:
+            draw_label(p, cx + 20, cy - 25, "HEAT", ("Consolas", 10, True), (255, 80, 80, 220))
 
-        p.setPen(QPen(QColor(0, 0, 0), 2))
-        p.setBrush(QColor(255, 255, 255))
 
-        tip = QPointF(cx, cy)
-        bottom = QPointF(cx, cy + size)
-        right = QPointF(cx + size * 0.5, cy + size * 0.6)
-        p.drawPolygon(tip, bottom, right)
+@register_mode
+class MetronomeMode(Mode):
+    """
+    Metronome: swinging arm line pivoting at center
+    """
 
-    def draw_blackhole(self, p: QPainter):
-        cx, cy = self.center_x, self.center_y
+    name = "metronome"
+    __slots__ = ("time",)
 
-        
-        self.draw_cross(p, cx, cy)
+    def __init__(self, overlay):
+        super().__init__(overlay)
+        self.time = 0.0
 
-        max_r = 55
-        p.setPen(Qt.NoPen)
+    def tick(self, dt):
+        self.time += dt
 
-        for i in range(4):
-            t = i / 4.0
-            r = max_r * (1.0 - 0.18 * i)
-            alpha = int(150 * (1.0 - t))
-            p.setBrush(QColor(10, 10, 15, alpha))
-            p.drawEllipse(QPointF(cx, cy), r, r)
+    def paint(self, p: Frame):
+        cx, cy = self.overlay.center_x, self.overlay.center_y
 
-        p.setBrush(QColor(0, 0, 0, 230))
-        p.drawEllipse(QPointF(cx, cy), 9, 9)
+        steps = self.phase_steps(2.0)
+        step = quantize((self.time * 0.5) % 1.0, steps)
 
-        p.setPen(QPen(QColor(255, 255, 255, 210), 2))
-        inner_r = 14
-        spokes = 6
+        def render(q):
+            # swings +-35 degrees, 40 px long; only runs on a sprite miss
+            angle_rad = math.radians(35.0) * math.sin(2 * math.pi * step / steps)
+            x2 = math.sin(angle_rad) * 40
+            y2 = -math.cos(angle_rad) * 40
 
-        for j in range(spokes):
-            ang = self.blackhole_phase + j * (2 * math.pi / spokes)
-            x1 = int(cx + math.cos(ang) * inner_r)
-            y1 = int(cy + math.sin(ang) * inner_r)
-            x2 = int(cx + math.cos(ang) * max_r)
-            y2 = int(cy + math.sin(ang) * max_r)
-            p.drawLine(x1, y1, x2, y2)
+            q.setPen(STYLES.pen((255, 255, 255), 2))
+            q.drawLine(0, 0, math.floor(x2), math.floor(y2))
 
-    def draw_panic(self, p: QPainter):
-        """
-        Panic: big heartbeat crosshair
-        """
-        cx, cy = self.center_x, self.center_y
-        speed_factor = 1.0 + min(self.cursor_speed / 40.0, 1.0) * 2.0
-        phase = (self.panic_phase * speed_factor) % 1.0
-        pulse = math.sin(phase * 2 * math.pi)
-        scale = 1.0 + 0.25 * pulse  
-        self.draw_cross(p, cx, cy, scale=scale * 1.4, length=18, gap=6, thickness=3)
-
-    def draw_jelly(self, p: QPainter):
-        """
-        Jelly: breathing ring instead of cross
-        """
-        cx, cy = self.center_x, self.center_y
-        radius = 10.0 * self.jelly_scale
-        self.draw_circle_shape(p, cx, cy, radius=radius, thickness=3)
+            
+            q.setPen(Qt.NoPen)
+            q.setBrush(STYLES.color((255, 255, 255)))
+            q.drawEllipse(QPointF(0, 0), 3, 3)
+
+        p.sprite(("metronome", steps, step), (-28, -44, 56, 50), render, cx, cy)
+
+
+@register_mode
+class MegaCrossMode(Mode):
+    """
+    Mega cross:
+    - huge connected cross across the whole screen
+    - very thick, bright colors
+    - slowly grows thicker over time (scale)
+    Drawn directly: two lines are cheaper than a screen-sized sprite.
+    """
+
+    name = "mega_cross"
+    __slots__ = ("scale", "lines")
+
+    def __init__(self, overlay):
+        super().__init__(overlay)
+        o = overlay
+        self.lines = [
+            QLine(0, o.center_y, o.screen_width, o.center_y),
+            QLine(o.center_x, 0, o.center_x, o.screen_height),
+        ]
+        self.enter()
 
-    def draw_broken(self, p: QPainter):
-        cx, cy = self.center_x, self.center_y
+    def enter(self):
+        self.scale = 0.0
 
-        t = self.broken_time
-        max_offset = 10
+    def tick(self, dt):
+        self.scale += dt * 0.02
 
-        if t <= self.broken_drift_time:
-            offset = int(max_offset * (t / self.broken_drift_time))
-        else:
-            offset = max_offset
+    def paint(self, p: Frame):
+        o = self.overlay
+        cx, cy = o.center_x, o.center_y
 
-        gap = 4 + offset
-        length = 12
+        
+        base_thickness = 8
+        extra = int(self.scale * 12)   
+        thickness = base_thickness + extra
 
-        p.save()
-        p.translate(cx, cy)
-        p.setPen(QPen(QColor(255, 255, 255), 2))
+        
+        t = self.scale * 3.0
+        r = int(180 + 75 * (math.sin(t) * 0.5 + 0.5))
+        g = int(80 + 120 * (math.sin(t + 2.1) * 0.5 + 0.5))
+        b = int(200 + 55 * (math.sin(t + 4.2) * 0.5 + 0.5))
+        color = (r, g, b, 230)
 
-        p.drawLine(-(gap + length), 0, -gap, 0)
-        p.drawLine(gap, 0, gap + length, 0)
-        p.drawLine(0, -(gap + length), 0, -gap)
-        p.drawLine(0, gap, 0, gap + length)
-        p.drawEllipse(QPointF(0, 0), 2, 2)
+        def render(q):
+            q.setPen(STYLES.pen(color, thickness))
+            q.drawLines(self.lines)
 
-        p.restore()
+            
+            q.setPen(Qt.NoPen)
+            q.setBrush(STYLES.color((255, 255, 255, 220)))
+            glow_radius = 6 + extra * 0.5
+            q.drawEllipse(QPointF(cx, cy), glow_radius, glow_radius)
+
+        m = int(max(thickness / 2.0, 6 + extra * 0.5)) + 2
+        p.direct(("mega_cross", thickness, color), [
+            (0, cy - m, o.screen_width, 2 * m),
+            (cx - m, 0, 2 * m, o.screen_height),
+        ], render)
+
+
+OverlayEvent = namedtuple("OverlayEvent", ["kind", "time", "data"])
+
+EVENT_KILLFEED = "killfeed"
+EVENT_HOTKEY = "hotkey"
+EVENT_RIGHT_CLICK = "right_click"
+
+
+class EventBus:
+    """
+    Hands events from the OCR / hotkey / mouse threads to the GUI tick.
+    - post() from any thread appends a timestamped OverlayEvent
+      (deque.append / popleft are atomic, no lock needed)
+    - drain() on the GUI thread yields every event since the last tick,
+      in order, so bursts are neither dropped nor merged
+    - on_post is called after each post (the overlay uses it to wake its timer)
+    """
+
+    def __init__(self, on_post=None):
+        self.queue = deque()
+        self.on_post = on_post
+
+    def post(self, kind, data=None, t=None):
+        self.queue.append(OverlayEvent(kind, time.perf_counter() if t is None else t, data))
+        if self.on_post:
+            self.on_post()
+
+    def drain(self):
+        queue = self.queue
+        while queue:
+            try:
+                yield queue.popleft()
+            except IndexError:
+                return
 
-    
-    def draw_lag_echo(self, p: QPainter):
-        """
-        Lagging crosshair:
-        - main dot at center
-        - trailing faint ghosts based on mouse movement
-        """
-        cx, cy = self.center_x, self.center_y
 
-       
-        self.draw_dot_shape(p, cx, cy, radius=4)
+class CursorReader:
+    """
+    Reads the global cursor position into .x / .y.
+    - Windows: GetCursorPos into one preallocated POINT, nothing allocated
+    - elsewhere: QCursor.pos() (a temporary QPoint per read)
+    read() returns False when the position isn't available.
+    """
 
-        if not self.lag_trail:
-            return
+    def __init__(self):
+        self.x = 0
+        self.y = 0
+        self._get = None
+        if sys.platform == "win32":
+            try:
+                from ctypes import wintypes
+                self._point = wintypes.POINT()
+                self._ptr = ctypes.pointer(self._point)
+                self._get = ctypes.windll.user32.GetCursorPos
+            except Exception as e:
+                print("[overlay] GetCursorPos unavailable, using QCursor:", e)
+
+    def read(self):
+        if self._get is not None:
+            if not self._get(self._ptr):
+                return False
+            self.x = self._point.x
+            self.y = self._point.y
+            return True
+        pos = QCursor.pos()
+        self.x = pos.x()
+        self.y = pos.y()
+        return True
+
+
+class FrameClock:
+    """
+    Real elapsed time between overlay ticks.
+    - dt comes from time.perf_counter, not the nominal timer interval, so
+      animations keep their speed when the timer fires late
+    - dt is clamped to max_dt: after a stall (alt-tab, suspend) animations
+      resume instead of jumping ahead
+    - next_interval_ms(): the timer wait to the next frame deadline; the
+      deadlines are exactly 1/fps apart, so whole-ms timer intervals average
+      out to the target (144 fps mixes 7 and 6 ms instead of running at 166 Hz)
+    """
+
+    def __init__(self, fps=TARGET_FPS, max_dt=MAX_FRAME_DT):
+        self.fps = fps
+        self.max_dt = max_dt
+        self.last = time.perf_counter()
+        self.deadline = self.last
+
+    def interval_ms(self):
+        return max(1, int(round(1000.0 / self.fps)))
+
+    def next_interval_ms(self):
+        now = time.perf_counter()
+        self.deadline += 1.0 / self.fps
+        if self.deadline < now:
+            # fell behind (stall, idle polling): start over from now
+            self.deadline = now + 1.0 / self.fps
+        return max(1, int(round((self.deadline - now) * 1000.0)))
+
+    def tick(self):
+        now = time.perf_counter()
+        dt = now - self.last
+        self.last = now
+        return min(max(dt, 0.0), self.max_dt)
+
+    def reset(self):
+        self.last = self.deadline = time.perf_counter()
+
+
+class LabelWindow(QWidget):
+    """
+    Small click-through window at the screen's top-left for the mode label
+    and the stats HUD. In compact mode the overlay window is a box around
+    the crosshair and would otherwise carry them into the middle of the view.
+    Both frames are in screen coordinates; refit() sizes the window to them.
+    """
+
+    def __init__(self, overlay):
+        super().__init__()
+        self.overlay = overlay
+        self.setWindowFlags(
+            Qt.FramelessWindowHint |
+            Qt.WindowStaysOnTopHint |
+            Qt.Tool
+        )
+        self.setAttribute(Qt.WA_TranslucentBackground, True)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
 
-        n = len(self.lag_trail)
-        for i, (ox, oy) in enumerate(self.lag_trail):
-            alpha = int(160 * (1.0 - i / max(1, n)))
-            radius = max(2, 4 - i)
-            p.save()
-            p.setPen(Qt.NoPen)
-            p.setBrush(QColor(255, 255, 255, max(0, alpha)))
-            p.drawEllipse(QPointF(cx + ox, cy + oy), radius, radius)
-            p.restore()
+    def refit(self):
+        o = self.overlay
+        region = o.label_frame.region(o.sprites) + o.hud_frame.region(o.sprites)
+        rect = region.boundingRect()
+        if not rect.isEmpty() and rect != self.geometry():
+            self.setGeometry(rect)
+        self.update()
 
-    def draw_focus_window(self, p: QPainter):
-        """
-        Focus window: camera viewfinder corners + blinking REC dot
-        """
-        cx, cy = self.center_x, self.center_y
+    def paintEvent(self, e):
+        o = self.overlay
+        p = QPainter(self)
+        p.setRenderHint(QPainter.Antialiasing)
+        try:
+            p.translate(-self.x(), -self.y())
+            o.label_frame.replay(p, o.sprites)
+            o.hud_frame.replay(p, o.sprites)
+        except Exception as err:
+            print("[overlay] draw error:", err)
+        p.end()
 
-        half_size = 20
-        corner_len = 10
 
-        p.setPen(QPen(QColor(255, 255, 255), 2))
-        p.setBrush(Qt.NoBrush)
+class CrosshairOverlay(QWidget):
+    # emitted (via EventBus.on_post) from the OCR / hotkey / mouse threads to wake an idle timer
+    wake_signal = pyqtSignal()
 
-        
-        p.drawLine(cx - half_size, cy - half_size, cx - half_size + corner_len, cy - half_size)
-        p.drawLine(cx - half_size, cy - half_size, cx - half_size, cy - half_size + corner_len)
+    def __init__(self, screen_width=1920, screen_height=1080, listeners=True):
+        super().__init__()
 
-       
-        p.drawLine(cx + half_size, cy - half_size, cx + half_size - corner_len, cy - half_size)
-        p.drawLine(cx + half_size, cy - half_size, cx + half_size, cy - half_size + corner_len)
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.center_x = screen_width // 2
+        self.center_y = screen_height // 2
+
+    
+        self.setWindowFlags(
+            Qt.FramelessWindowHint |
+            Qt.WindowStaysOnTopHint |
+            Qt.Tool
+        )
+        self.setAttribute(Qt.WA_TranslucentBackground, True)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        self.window_rect = QRect(0, 0, self.screen_width, self.screen_height)
+        self.window_mode = None
+        self.setGeometry(self.window_rect)
 
         
-        p.drawLine(cx - half_size, cy + half_size, cx - half_size + corner_len, cy + half_size)
-        p.drawLine(cx - half_size, cy + half_size, cx - half_size, cy + half_size - corner_len)
+        self.mode_objects = {name: cls(self) for name, cls in MODES.items()}
+        self.modes = list(self.mode_objects)
+        self.mode_index = 0
+        self.current_mode = self.modes[0]
+        self.mode = self.mode_objects[self.current_mode]
+        for name in self.modes:
+            STYLES.text(name, LABEL_FONT)
 
         
-        p.drawLine(cx + half_size, cy + half_size, cx + half_size - corner_len, cy + half_size)
-        p.drawLine(cx + half_size, cy + half_size, cx + half_size, cy + half_size - corner_len)
+        self.events = EventBus(on_post=self.wake_signal.emit)
+
+        self.sprites = SpriteCache()
+        self.frame = Frame()
+        self.spare_frame = Frame()
+        self.frame_region = QRegion()
+        self.label_frame = Frame()
+        self.hud_frame = Frame()
+        # the overlay only spans the whole screen without COMPACT_WINDOW
+        self.label_window = LabelWindow(self) if COMPACT_WINDOW else None
+
+        self.stats = Stats()
+        self.hud_next = 0.0
+        self.stats_next = time.perf_counter() + STATS_INTERVAL
 
         
-        blink_on = (self.panic_phase % 1.0) < 0.5
-        if blink_on:
-            p.setPen(Qt.NoPen)
-            p.setBrush(QColor(255, 80, 80, 220))
-            rec_x = cx + half_size + 18
-            rec_y = cy - half_size - 2
-            p.drawEllipse(QPointF(rec_x, rec_y), 4, 4)
-
-            p.setPen(QPen(QColor(255, 255, 255, 220), 1))
-            p.setFont(QFont("Consolas", 9))
-            p.drawText(rec_x + 8, rec_y + 3, "REC")
-
-    def draw_overheated(self, p: QPainter):
-        """
-        Overheated crosshair:
-        - color + shake + size based on heat value (0..1)
-        """
-        cx, cy = self.center_x, self.center_y
+        fps = TARGET_FPS
+        if not fps:
+            screen = QApplication.primaryScreen()
+            fps = screen.refreshRate() if screen else 60.0
+        self.clock = FrameClock(fps)
 
-        heat = self.heat
         
-        r = 255
-        g = int(255 * (1.0 - 0.7 * heat))
-        b = int(255 * (1.0 - 0.9 * heat))
+        # mode images load on first use; preloaded in the background once the window is up
+        self.assets = AssetCache()
+        self.dpr = 1.0
+        self.first_show = True
 
         
-        shake = 1.0 + 4.0 * heat
-        jitter_x = random.uniform(-shake, shake)
-        jitter_y = random.uniform(-shake, shake)
+        self.cursor = CursorReader()   # swapped for synthetic input by --bench-render
+        self.cursor_speed = 0.0
+        self.cursor_dx = 0.0
+        self.cursor_dy = 0.0
+        self.have_cursor = False
+        self.last_cursor_x = 0
+        self.last_cursor_y = 0
 
         
-        scale = 1.0 + 0.6 * heat
+        self.timer = QTimer()
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.on_tick)
+        self.timer.start(self.clock.interval_ms())
+        self.idle = False
+        self.wake_signal.connect(self._wake)
 
-        p.save()
-        p.translate(cx + jitter_x, cy + jitter_y)
-        p.scale(scale, scale)
-        p.setPen(QPen(QColor(r, g, b), 3))
+        print("[overlay] started. Modes:", self.modes)
+        print(f"[overlay] target {self.clock.fps:.0f} fps")
 
-        length = 14
-        gap = 5
+        if listeners:
+            self._start_ocr_watcher()
+            self._start_hotkey_listener()
+            self._start_mouse_listener()
 
-        p.drawLine(-gap - length, 0, -gap, 0)
-        p.drawLine(gap, 0, gap + length, 0)
-        p.drawLine(0, -gap - length, 0, -gap)
-        p.drawLine(0, gap, 0, gap + length)
-        p.drawEllipse(QPointF(0, 0), 2, 2)
+   
+    def _start_hotkey_listener(self):
+        def worker():
+            try:
+                import keyboard
+            except Exception as e:
+                print("[overlay] keyboard import failed, hotkey disabled:", e)
+                return
+            try:
+                keyboard.add_hotkey(HOTKEY_KEY, lambda: self.events.post(EVENT_HOTKEY))
+                keyboard.wait()
+            except Exception as e:
+                print("[overlay] keyboard listener error:", e)
 
-        p.restore()
+        t = threading.Thread(target=worker, daemon=True)
+        t.start()
 
-        
-        if heat > 0.75:
-            p.setPen(QPen(QColor(255, 80, 80, 220)))
-            p.setFont(QFont("Consolas", 10, QFont.Bold))
-            p.drawText(cx + 20, cy - 25, "HEAT")
+    
+    def _start_mouse_listener(self):
+        def worker():
+            try:
+                import mouse
+            except Exception as e:
+                print("[overlay] mouse import failed, sleepy wake disabled:", e)
+                return
+            try:
+                mouse.on_right_click(lambda: self.events.post(EVENT_RIGHT_CLICK))
+                mouse.wait()
+            except Exception as e:
+                print("[overlay] mouse listener error:", e)
+
+        t = threading.Thread(target=worker, daemon=True)
+        t.start()
 
-    def draw_metronome(self, p: QPainter):
+    def _handle_event(self, ev):
+        self.stats.hit(ev.kind)
+        if ev.kind == EVENT_KILLFEED:
+            latency = (time.perf_counter() - ev.time) * 1000.0
+            self.stats.record("event_latency", latency)
+            self._cycle_mode("killfeed " + ev.data[0])
+            print(f"[overlay] killfeed → mode change latency: {latency:.0f} ms")
+        elif ev.kind == EVENT_HOTKEY:
+            self._cycle_mode("hotkey")
+        elif ev.kind == EVENT_RIGHT_CLICK:
+            if self.current_mode == "sleepy":
+                self.mode.wake()
+                print("[overlay] sleepy wake: right-click")
+
+    
+    def _start_ocr_watcher(self):
+        if OCR_IN_PROCESS:
+            self._start_ocr_process()
+            return
+
+        t = threading.Thread(
+            target=run_ocr_watcher,
+            args=(self.screen_width, self._on_killfeed_hit, self.stats),
+            daemon=True,
+        )
+        t.start()
+
+    def _start_ocr_process(self):
         """
-        Metronome: swinging arm line pivoting at center
+        Capture + preprocess + OCR in a child process (no GIL contention with
+        painting); only match events come back, through a multiprocessing queue.
         """
-        cx, cy = self.center_x, self.center_y
+        hits = multiprocessing.Queue()
+        proc = multiprocessing.Process(
+            target=ocr_process_main,
+            args=(self.screen_width, hits),
+            daemon=True,
+        )
+        proc.start()
+        print("[overlay] OCR process started, pid", proc.pid)
 
-        max_angle_deg = 35.0
-        
-        ang = math.sin(self.metronome_time * 2 * math.pi * 0.5)
-        angle_rad = math.radians(max_angle_deg) * ang
+        def reader():
+            while True:
+                try:
+                    kind, snippet, grab_time = hits.get()
+                except Exception as e:
+                    print("[overlay] OCR process queue closed:", e)
+                    return
+                self._on_killfeed_hit(kind, snippet, grab_time)
+
+        t = threading.Thread(target=reader, daemon=True)
+        t.start()
+
+    def _on_killfeed_hit(self, kind, snippet, grab_time):
+        print(f"[overlay] killfeed {kind} →", snippet[:80])
+        self.events.post(EVENT_KILLFEED, (kind, snippet), grab_time)
+
+    
+    def _cycle_mode(self, reason=""):
+        self._set_mode(self.modes[(self.mode_index + 1) % len(self.modes)], reason)
+
+    def _set_mode(self, name, reason=""):
+        prev = self.current_mode
+        self.mode_index = self.modes.index(name)
+        self.current_mode = name
+        print(f"[overlay] mode: {prev} → {self.current_mode} ({reason})")
 
-        length = 40
+        self.mode = self.mode_objects[self.current_mode]
+        self.mode.enter()
 
-        x2 = cx + math.sin(angle_rad) * length
-        y2 = cy - math.cos(angle_rad) * length  
+   
+    def on_tick(self):
+        t0 = time.perf_counter()
+        dt = self.clock.tick()
 
-        p.setPen(QPen(QColor(255, 255, 255), 2))
-        p.drawLine(cx, cy, int(x2), int(y2))
+        # everything the other threads posted since the last tick, in order
+        if self.events.queue:
+            for ev in self.events.drain():
+                self._handle_event(ev)
 
         
-        self.draw_dot_shape(p, cx, cy, radius=3)
+        dx = dy = 0.0
+        cursor = self.cursor
+        try:
+            if cursor.read():
+                if self.have_cursor:
+                    dx = cursor.x - self.last_cursor_x
+                    dy = cursor.y - self.last_cursor_y
+                    # px per PHYSICS_DT, smoothed by 0.8 per PHYSICS_DT: the
+                    # same hand speed reads the same at any tick rate
+                    n = max(dt / PHYSICS_DT, 1e-6)
+                    keep = 0.8 ** n
+                    dist = math.hypot(dx, dy)
+                    self.cursor_speed = self.cursor_speed * keep + dist * (1.0 - keep) / n
+                self.last_cursor_x = cursor.x
+                self.last_cursor_y = cursor.y
+                self.have_cursor = True
+        except Exception:
+            pass
+        self.cursor_dx = dx
+        self.cursor_dy = dy
+
+        # only the active mode is simulated
+        self.mode.tick(dt)
+
+        self._schedule_repaint()
+        self._update_idle(dx == 0.0 and dy == 0.0)
+        if not self.idle:
+            self.timer.start(self.clock.next_interval_ms())
+
+        now = time.perf_counter()
+        self.stats.record("tick", (now - t0) * 1000.0)
+        if STATS_HUD and now >= self.hud_next:
+            self.hud_next = now + 0.5
+            self._update_hud()
+        if STATS_LOG and now >= self.stats_next:
+            self.stats_next = now + STATS_INTERVAL
+            self._dump_stats(now)
+
+    def _update_hud(self):
+        """Stats lines to the right of the mode label (screen top-left)."""
+        def ms(name, fmt="{:.2f}"):
+            st = self.stats.summary(name)
+            if st is None:
+                return "-"
+            return (fmt + "/" + fmt).format(st["mean"], st["p99"])
+
+        rate = sum(r.rate(time.perf_counter()) for r in list(self.stats.rates.values()))
+        lines = [
+            f"tick  {ms('tick')} ms",
+            f"paint {ms('paint')} ms",
+            f"ocr   {ms('ocr', '{:.0f}')} ms",
+            f"lat   {ms('event_latency', '{:.0f}')} ms",
+            f"events {rate:.2f}/s",
+        ]
+        font = STYLES.font(LABEL_FONT)
+        fm = STYLES.font_metrics(LABEL_FONT)
+        x = 10 + fm.horizontalAdvance(self.current_mode) + 12
+        step = fm.lineSpacing()
+        w = max(fm.horizontalAdvance(line) for line in lines) + 4
+        rect = QRect(x - 2, 20 - fm.ascent() - 2, w, step * len(lines) + 4)
+
+        def render(q):
+            q.setFont(font)
+            q.setPen(STYLES.pen((0, 0, 0, 180)))
+            for i, line in enumerate(lines):
+                q.drawText(x, 20 + i * step, line)
+
+        old = self.hud_frame.region(self.sprites).boundingRect()
+        self.hud_frame = Frame()
+        self.hud_frame.direct(("hud", tuple(lines)), [rect.getRect()], render)
+        if self.label_window:
+            self.label_window.refit()
+        else:
+            self.update(old.united(rect))
 
-    def draw_mega_cross(self, p: QPainter):
+    def _dump_stats(self, now):
+        import json
+
+        snap = self.stats.snapshot(now)
+        snap["mode"] = self.current_mode
+        try:
+            with open(STATS_LOG, "a", encoding="utf-8") as f:
+                f.write(json.dumps(snap) + "\n")
+        except OSError as e:
+            print("[overlay] stats log error:", e)
+
+    def _update_idle(self, cursor_still):
         """
-        Mega cross:
-        - huge connected cross across the whole screen
-        - very thick, bright colors
-        - slowly grows thicker over time (mega_scale)
+        Throttle the tick timer while the frame can't change:
+        - stop it if nothing but an event can change the frame
+        - poll at IDLE_FPS if only cursor movement can
+        - back to the full rate otherwise (on_tick then times each tick
+          to the next frame deadline)
         """
-        cx, cy = self.center_x, self.center_y
+        idle = cursor_still and self.mode.is_static()
+        if idle == self.idle:
+            return
 
-        
-        base_thickness = 8
-        extra = int(self.mega_scale * 12)   
-        thickness = base_thickness + extra
+        self.idle = idle
+        if not idle:
+            return
+        if not self.mode.uses_cursor:
+            self.timer.stop()
+            # movement while stopped isn't one tick's worth
+            self.have_cursor = False
+        else:
+            self.timer.start(int(1000 / IDLE_FPS))
 
-        
-        t = self.mega_scale * 3.0
-        r = int(180 + 75 * (math.sin(t) * 0.5 + 0.5))
-        g = int(80 + 120 * (math.sin(t + 2.1) * 0.5 + 0.5))
-        b = int(200 + 55 * (math.sin(t + 4.2) * 0.5 + 0.5))
-        color = QColor(r, g, b, 230)
+    def _wake(self):
+        if self.idle:
+            self.idle = False
+            self.clock.reset()
+            self.timer.start(self.clock.interval_ms())
+            self.on_tick()
 
-        p.setPen(QPen(color, thickness))
+    
+    def _compose_frame(self):
+        # two Frames take turns, the one on screen is never touched
+        frame = self.spare_frame
+        frame.clear()
+        try:
+            self.mode.paint(frame)
+        except Exception as err:
+            print("[overlay] draw error:", err)
+            frame.clear()
+            draw_cross(frame, self.center_x, self.center_y)
 
-        
-        p.drawLine(0, cy, self.screen_width, cy)
-        
-        p.drawLine(cx, 0, cx, self.screen_height)
+        return frame
 
-        
-        p.setPen(Qt.NoPen)
-        p.setBrush(QColor(255, 255, 255, 220))
-        glow_radius = 6 + extra * 0.5
-        p.drawEllipse(QPointF(cx, cy), glow_radius, glow_radius)
+    def _schedule_repaint(self):
+        """Repaint only what changed: old + new frame area, nothing if identical."""
+        frame = self._compose_frame()
+        mode_changed = self.current_mode != self.window_mode
+        if frame.keys == self.frame.keys and not mode_changed:
+            return
+
+        region = self.mode.bounds(frame)
+        self.spare_frame = self.frame
+        self.frame = frame
+        bounds = region.boundingRect()
+
+        if mode_changed or not self.window_rect.contains(bounds):
+            self.window_mode = self.current_mode
+            self.label_frame = Frame()
+            
+            draw_label(self.label_frame, 10, 20, self.current_mode,
+                            LABEL_FONT, (0, 0, 0, 180))
+            if self.label_window:
+                self.label_window.refit()
+            if COMPACT_WINDOW:
+                # new mode: fit (may shrink); same mode: only ever grow
+                self._fit_window(bounds, grow=not mode_changed)
+            self.frame_region = region
+            self.update()
+            return
 
+        self.update((region + self.frame_region).translated(-self.window_rect.topLeft()))
+        self.frame_region = region
+
+    def _fit_window(self, bounds, grow=False):
+        half = COMPACT_MIN_SIZE // 2
+        rect = QRect(self.center_x - half, self.center_y - half, 2 * half, 2 * half)
+        rect = rect.united(bounds.adjusted(-16, -16, 16, 16))
+        if grow:
+            rect = rect.united(self.window_rect)
+        rect = rect.intersected(QRect(0, 0, self.screen_width, self.screen_height))
+        if rect != self.window_rect:
+            self.window_rect = rect
+            self.setGeometry(rect)
+
+    def asset(self, name, scale=1.0):
+        """(pixmap, w, h) of a mode image for this screen's pixel ratio, or None."""
+        return self.assets.pixmap(name, scale, self.dpr)
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        if self.label_window:
+            self.label_window.show()
+        self.dpr = self.devicePixelRatioF()
+        if self.first_show:
+            self.first_show = False
+            self.windowHandle().screenChanged.connect(self._screen_changed)
+            if PRELOAD_ASSETS:
+                # after the first frame is up, not in the way of it
+                QTimer.singleShot(0, self._preload_assets)
+
+    def hideEvent(self, e):
+        super().hideEvent(e)
+        if self.label_window:
+            self.label_window.hide()
+
+    def _screen_changed(self, screen):
+        self.dpr = self.devicePixelRatioF()
+
+    def _preload_assets(self):
+        jobs = [(name, 1.0, self.dpr) for name in ASSET_SIZES]
+        jobs += [("duck_guy.png", s, self.dpr) for s in DuckMode.scales[1:]]
+        self.assets.preload(jobs)
+
+    def paintEvent(self, e):
+        t0 = time.perf_counter()
+        p = QPainter(self)
+        self.paint_to(p)
+        p.end()
+        self.stats.record("paint", (time.perf_counter() - t0) * 1000.0)
+
+    def paint_to(self, p: QPainter):
+        p.setRenderHint(QPainter.Antialiasing)
+        try:
+            # frames are in screen coordinates, the window may be a small box
+            p.translate(-self.window_rect.x(), -self.window_rect.y())
+            self.frame.replay(p, self.sprites)
+            if not self.label_window:
+                # full-screen window: screen and window coordinates are the same
+                p.resetTransform()
+                self.label_frame.replay(p, self.sprites)
+                self.hud_frame.replay(p, self.sprites)
+        except Exception as err:
+            print("[overlay] draw error:", err)
+
+    
+class SweepCursor:
+    """Synthetic cursor for offscreen runs: a looping sweep that pauses now and then."""
+
+    def __init__(self, cx, cy):
+        self.cx = cx
+        self.cy = cy
+        self.step = 0   # set by the caller, one per frame
+        self.x = cx
+        self.y = cy
+
+    def read(self):
+        i = self.step
+        if i % 240 >= 180:
+            i -= i % 240 - 180   # hold still for a while
+        self.x = self.cx + int(220 * math.sin(i * 0.05))
+        self.y = self.cy + int(140 * math.sin(i * 0.077))
+        return True
+
+
+def offscreen_overlay():
+    """
+    (app, overlay) for headless runs: no listeners, timer stopped, a fixed
+    dt of 1 / TARGET_FPS per tick and a SweepCursor for input.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication.instance() or QApplication(sys.argv)
+    overlay = CrosshairOverlay(1920, 1080, listeners=False)
+    overlay.timer.stop()
+    overlay.cursor = SweepCursor(overlay.center_x, overlay.center_y)
+    dt = 1.0 / (TARGET_FPS or 60)
+    overlay.clock.tick = lambda: dt
+    return app, overlay
+
+
+def check_alloc(frames=240, warmup=240, windows=2, limit=1024, only=None):
+    """
+    Steady-state allocation check: each mode is ticked and painted offscreen
+    for `warmup` frames, then for `windows` runs of `frames` more, all under
+    tracemalloc. A mode fails if memory still held grew by more than `limit`
+    bytes in every window, i.e. if something accumulates per tick.
+    - one-off growth (sip's wrapper map or the interpreter's frame stack
+      resizing) lands in a single window; a leak shows up in all of them
+    - StylePool tables and SpriteCache entries are left out: they fill up to
+      their caps by design (animated colours keep adding keys for a while)
+    - short-lived garbage shows up as peak, which is reported, not judged
+    Returns True if every mode passes.
+    """
+    import inspect
+    import tracemalloc
+
+    def source_lines(obj):
+        lines, first = inspect.getsourcelines(obj)
+        return range(first, first + len(lines))
+
+    source = inspect.getsourcefile(StylePool)
+    skip = {(source, n) for obj in (StylePool, SpriteCache.draw) for n in source_lines(obj)}
+
+    def held():
+        """Traced bytes, minus capped caches and tracemalloc's own bookkeeping."""
+        return sum(t.size for t in tracemalloc.take_snapshot().traces
+                   if not any(f.filename == tracemalloc.__file__ or (f.filename, f.lineno) in skip
+                              for f in t.traceback))
+
+    _app, overlay = offscreen_overlay()
+    image = [None]
+
+    def frame(i):
+        overlay.cursor.step = i
+        overlay.on_tick()
+        size = overlay.window_rect.size()
+        if image[0] is None or image[0].size() != size:
+            image[0] = QImage(size, QImage.Format_ARGB32_Premultiplied)
+        image[0].fill(Qt.transparent)
+        p = QPainter(image[0])
+        overlay.paint_to(p)
+        p.end()
+
+    ok = True
+    print(f"[alloc] {windows} x {frames} frames per mode after {warmup} warm-up, "
+          f"limit {limit} B net per window")
+    tracemalloc.start(6)
+    for name in (only or overlay.modes):
+        random.seed(0)
+        overlay._set_mode(name, "check")
+        overlay.have_cursor = False
+        for i in range(warmup):
+            frame(i)
+        nets = []
+        peak = 0
+        for w in range(windows):
+            before = held()
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            start = warmup + w * frames
+            for i in range(start, start + frames):
+                frame(i)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+            nets.append(held() - before)
+        passed = min(nets) <= limit
+        ok = ok and passed
+        print(f"[alloc] {name:<14} net {' '.join(f'{n:+7d}' for n in nets)} B   "
+              f"peak {peak:7d} B   {'ok' if passed else 'FAIL'}")
+    tracemalloc.stop()
+    print("[alloc] passed" if ok else "[alloc] FAILED")
+    return ok
+
+
+def bench_render(frames=600, warmup=30, only=None, json_path=None):
+    """
+    Steps every mode offscreen for `frames` ticks at TARGET_FPS with a
+    synthetic cursor (a looping sweep that pauses now and then), painting
+    each frame into a QImage the size of the overlay window.
+    - tick: on_tick (events, cursor, simulation, display list, repaint check)
+    - paint: the same replay paintEvent does, always the whole window
+    - alloc: peak traced memory of a tick + paint and net growth over the
+      run, from a second pass under tracemalloc so it doesn't skew the times
+    - gc0: generation-0 collections during the timed run
+    The first `warmup` frames (sprite cache fill) aren't counted.
+    """
+    import gc
+    import json
+    import tracemalloc
+    from PyQt5.QtCore import QT_VERSION_STR
+
+    _app, overlay = offscreen_overlay()
+    image = [None]
+
+    def run(name, trace):
+        """One pass over a mode; timing and tracemalloc passes are separate."""
+        random.seed(0)
+        overlay._set_mode(name, "bench")
+        overlay.have_cursor = False
+        # preallocated, so the timing itself doesn't show up as allocations
+        ticks, paints = np.empty(frames), np.empty(frames)
+        peak = net = 0
+        if trace:
+            tracemalloc.start()
+        for i in range(warmup + frames):
+            overlay.cursor.step = i
+            if i == warmup:
+                gc0 = gc.get_stats()[0]["collections"]
+                if trace:
+                    base = tracemalloc.get_traced_memory()[0]
+            if trace:
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+
+            t0 = time.perf_counter()
+            overlay.on_tick()
+            t1 = time.perf_counter()
+
+            size = overlay.window_rect.size()
+            if image[0] is None or image[0].size() != size:
+                image[0] = QImage(size, QImage.Format_ARGB32_Premultiplied)
+            image[0].fill(Qt.transparent)
+            t2 = time.perf_counter()
+            p = QPainter(image[0])
+            overlay.paint_to(p)
+            p.end()
+            t3 = time.perf_counter()
+
+            if i >= warmup:
+                ticks[i - warmup] = t1 - t0
+                paints[i - warmup] = t3 - t2
+                if trace:
+                    peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+        if trace:
+            net = tracemalloc.get_traced_memory()[0] - base
+            tracemalloc.stop()
+        gc0 = gc.get_stats()[0]["collections"] - gc0
+        return ticks * 1000.0, paints * 1000.0, peak, net, gc0, size
+
+    results = OrderedDict()
+    for name in (only or overlay.modes):
+        ticks, paints, _, _, gc0, size = run(name, trace=False)
+        _, _, peak, net, _, _ = run(name, trace=True)
+        results[name] = OrderedDict([
+            ("tick_mean_ms", float(ticks.mean())),
+            ("tick_p99_ms", float(np.percentile(ticks, 99))),
+            ("paint_mean_ms", float(paints.mean())),
+            ("paint_p99_ms", float(np.percentile(paints, 99))),
+            ("alloc_peak_kb", peak / 1024.0),
+            ("alloc_net_kb", net / 1024.0),
+            ("gc0", gc0),
+            ("window", [size.width(), size.height()]),
+        ])
+
+    print(f"[bench] render, {frames} frames per mode (ms; alloc in KB)")
+    print(f"[bench] {'mode':<14}{'tick':>8}{'p99':>8}{'paint':>8}{'p99':>8}{'peak':>8}{'net':>8}{'gc0':>5}")
+    for name, r in results.items():
+        print(
+            f"[bench] {name:<14}{r['tick_mean_ms']:8.3f}{r['tick_p99_ms']:8.3f}"
+            f"{r['paint_mean_ms']:8.3f}{r['paint_p99_ms']:8.3f}"
+            f"{r['alloc_peak_kb']:8.1f}{r['alloc_net_kb']:8.1f}{r['gc0']:5d}"
+        )
+
+    if json_path:
+        report = OrderedDict([
+            ("frames", frames),
+            ("fps", TARGET_FPS),
+            ("sprites", USE_SPRITES),
+            ("qt", QT_VERSION_STR),
+            ("python", sys.version.split()[0]),
+            ("modes", results),
+        ])
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print("[bench] wrote", json_path)
+    return results
+
+
+def bench_curves(calls=200000):
+    """Per-frame animation maths: math calls vs the Curve lookups."""
+    steps = SPRITE_PHASE_STEPS
+    t = 1.2345
+    step = 37
+    sine = Curve(lambda u: np.sin(2 * np.pi * u), 256)
+    bob = keyframes([(0.25, 10.0, "sine"), (0.75, -10.0, "sine")])
+
+    arm = Curve(lambda u: np.stack([
+        np.sin(np.radians(35.0) * np.sin(2 * np.pi * u)) * 40,
+        -np.cos(np.radians(35.0) * np.sin(2 * np.pi * u)) * 40,
+    ], axis=1))
+
+    def arm_math():
+        angle_rad = math.radians(35.0) * math.sin(2 * math.pi * step / steps)
+        return math.sin(angle_rad) * 40, -math.cos(angle_rad) * 40
+
+    cases = [
+        ("2-D step", arm_math, lambda: arm[step]),
+        ("Curve.step", lambda: math.sin(2 * math.pi * t), lambda: sine.step(t % 1.0)),
+        ("Curve.at", lambda: math.sin(2 * math.pi * t), lambda: sine.at(t)),
+        ("keyframes", lambda: 10.0 * math.sin(2 * math.pi * t), lambda: bob.step(t % 1.0)),
+    ]
+    for name, old, new in cases:
+        times = []
+        for fn in (old, new):
+            t0 = time.perf_counter()
+            for _ in range(calls):
+                fn()
+            times.append((time.perf_counter() - t0) * 1e9 / calls)
+        print(f"[bench] {name:<12} math {times[0]:6.0f} ns   table {times[1]:6.0f} ns")
+
+
+def arg_value(flag, default=None):
+    """Value after `flag` on the command line (flags themselves don't count)."""
+    if flag in sys.argv:
+        i = sys.argv.index(flag) + 1
+        if i < len(sys.argv) and not sys.argv[i].startswith("--"):
+            return sys.argv[i]
+    return default
 
 
 def main():
+    multiprocessing.freeze_support()
+    if "--bench-preprocess" in sys.argv:
+        bench_preprocess()
+        return
+    if "--bench-ocr" in sys.argv:
+        bench_ocr()
+        return
+    if "--bench-match" in sys.argv:
+        bench_match(arg_value("--bench-match"))
+        return
+    if "--bench-curves" in sys.argv:
+        bench_curves()
+        return
+    if "--check-alloc" in sys.argv:
+        only = arg_value("--modes")
+        ok = check_alloc(only=only.split(",") if only else None)
+        sys.exit(0 if ok else 1)
+    if "--bench-render" in sys.argv:
+        only = arg_value("--modes")
+        bench_render(
+            frames=int(arg_value("--frames", 600)),
+            only=only.split(",") if only else None,
+            json_path=arg_value("--json"),
+        )
+        return
+    if "--replay" in sys.argv:
+        replay(
+            arg_value("--replay"),
+            labels_path=arg_value("--labels"),
+            fps=float(arg_value("--fps", 10)),
+            screen_width=int(arg_value("--screen-width", 1920)),
+            json_path=arg_value("--json"),
+        )
+        return
+
     app = QApplication(sys.argv)
     overlay = CrosshairOverlay(1920, 1080)
     overlay.show()